@@ -22,7 +22,10 @@ from .utils import (
     safe_vector3,
     chunk_list,
     get_file_size_mb,
-    is_safe_file_extension
+    is_safe_file_extension,
+    json_dumps,
+    json_loads,
+    write_file_atomic
 )
 
 # Import error handling
@@ -38,7 +41,7 @@ from .error_handler import (
 )
 
 # Import configuration management
-from .config import DFM_Config, DFM_ConfigManager, config_manager
+from .config import DFM_Config, DFM_ConfigManager, config_manager, get_config_manager
 
 # Import core classes
 from .material_exporter import DFM_MaterialExporter
@@ -70,6 +73,7 @@ __all__ = [
     'DFM_Config',
     'DFM_ConfigManager',
     'config_manager',
+    'get_config_manager',
     
     # Error handling
     'DFM_Error',
@@ -91,6 +95,9 @@ __all__ = [
     'chunk_list',
     'get_file_size_mb',
     'is_safe_file_extension',
+    'json_dumps',
+    'json_loads',
+    'write_file_atomic',
     
     # Core classes
     'DFM_MaterialExporter',
@@ -2,14 +2,24 @@
 Configuration management for Difference Engine addon
 """
 import os
-import json
 import logging
 from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, fields
+from .utils import json_dumps, json_loads
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# (field name, check, message) rules applied by DFM_Config.validate
+_VALIDATORS = (
+    ('DEFAULT_CHUNK_SIZE', lambda v: v > 0, "must be positive"),
+    ('MAX_SEARCH_RESULTS', lambda v: v > 0, "must be positive"),
+    ('AUTO_COMPRESS_THRESHOLD', lambda v: v >= 0, "must be non-negative"),
+    ('MAX_FILE_SIZE_MB', lambda v: v > 0, "must be positive"),
+    ('BACKUP_RETENTION_DAYS', lambda v: v >= 0, "must be non-negative"),
+    ('ALLOWED_FILE_EXTENSIONS', bool, "must not be empty"),
+)
+
 
 @dataclass
 class DFM_Config:
@@ -33,17 +43,22 @@ class DFM_Config:
     SHOW_DEBUG_INFO: bool = False
     
     # Security settings
-    ALLOWED_FILE_EXTENSIONS: tuple = ('.json', '.png', '.jpg', '.jpeg', '.tga', '.bmp', '.exr')
+    ALLOWED_FILE_EXTENSIONS: frozenset = field(
+        default_factory=lambda: frozenset({'.json', '.png', '.jpg', '.jpeg', '.tga', '.bmp', '.exr'})
+    )
     MAX_PATH_LENGTH: int = 255
     
     @classmethod
     def load_from_file(cls, config_path: str) -> 'DFM_Config':
         """Load configuration from JSON file"""
         try:
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    data = json.load(f)
-                return cls(**data)
+            with open(config_path, 'rb') as f:
+                data = json_loads(f.read())
+            if 'ALLOWED_FILE_EXTENSIONS' in data:
+                data['ALLOWED_FILE_EXTENSIONS'] = frozenset(data['ALLOWED_FILE_EXTENSIONS'])
+            return cls(**data)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.warning(f"Failed to load config from {config_path}: {e}")
         
@@ -53,8 +68,11 @@ class DFM_Config:
         """Save configuration to JSON file"""
         try:
             os.makedirs(os.path.dirname(config_path), exist_ok=True)
-            with open(config_path, 'w') as f:
-                json.dump(asdict(self), f, indent=2)
+            data = {name: getattr(self, name) for name in _FIELD_NAMES}
+            # JSON has no set type; store extensions as a sorted list
+            data['ALLOWED_FILE_EXTENSIONS'] = sorted(self.ALLOWED_FILE_EXTENSIONS)
+            with open(config_path, 'wb') as f:
+                f.write(json_dumps(data, pretty=True))
             return True
         except Exception as e:
             logger.error(f"Failed to save config to {config_path}: {e}")
@@ -69,27 +87,10 @@ class DFM_Config:
         Raises:
             ValueError: If configuration contains invalid values
         """
-        errors = []
-        
-        if self.DEFAULT_CHUNK_SIZE <= 0:
-            errors.append("DEFAULT_CHUNK_SIZE must be positive")
-        
-        if self.MAX_SEARCH_RESULTS <= 0:
-            errors.append("MAX_SEARCH_RESULTS must be positive")
-        
-        if self.AUTO_COMPRESS_THRESHOLD < 0:
-            errors.append("AUTO_COMPRESS_THRESHOLD must be non-negative")
-        
-        if self.MAX_FILE_SIZE_MB <= 0:
-            errors.append("MAX_FILE_SIZE_MB must be positive")
+        errors = [f"{name} {message}" for name, is_valid, message in _VALIDATORS
+                  if not is_valid(getattr(self, name))]
         
-        if self.BACKUP_RETENTION_DAYS < 0:
-            errors.append("BACKUP_RETENTION_DAYS must be non-negative")
-        
-        if not self.ALLOWED_FILE_EXTENSIONS:
-            errors.append("ALLOWED_FILE_EXTENSIONS must not be empty")
-        
-        if len(errors) > 0:
+        if errors:
             error_msg = "Configuration validation failed:\n" + "\n".join(f"  - {err}" for err in errors)
             logger.error(error_msg)
             raise ValueError(error_msg)
@@ -97,21 +98,29 @@ class DFM_Config:
         return True
 
 
+# Flat field list for save_to_file; avoids asdict()'s recursive deep copy
+_FIELD_NAMES = tuple(f.name for f in fields(DFM_Config))
+
+
 class DFM_ConfigManager:
     """Manages configuration for Difference Engine"""
     
+    # _loaded_path/_loaded_mtime: path and st_mtime_ns of the config file
+    # behind the current _config
+    __slots__ = ('_config', '_loaded_path', '_loaded_mtime')
+    
     _instance: Optional['DFM_ConfigManager'] = None
-    _config: Optional[DFM_Config] = None
     
     def __new__(cls) -> 'DFM_ConfigManager':
+        # State is set up once here; there is no __init__ to re-run on each call
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            instance = super().__new__(cls)
+            instance._config = DFM_Config()
+            instance._loaded_path = None
+            instance._loaded_mtime = None
+            cls._instance = instance
         return cls._instance
     
-    def __init__(self):
-        if self._config is None:
-            self._config = DFM_Config()
-    
     @property
     def config(self) -> DFM_Config:
         """Get current configuration"""
@@ -128,11 +137,25 @@ class DFM_ConfigManager:
         """
         try:
             config_path = os.path.join(base_path, 'config.json')
+            
+            # Reuse the parsed configuration if the file is unchanged since the last load
+            try:
+                mtime = os.stat(config_path).st_mtime_ns
+            except OSError:
+                mtime = None
+            if (mtime is not None and self._config is not None
+                    and self._loaded_path == config_path and self._loaded_mtime == mtime):
+                return True
+            
+            self._loaded_path = None
+            self._loaded_mtime = None
             self._config = DFM_Config.load_from_file(config_path)
             
             # Validate may raise ValueError
             try:
                 self._config.validate()
+                self._loaded_path = config_path
+                self._loaded_mtime = mtime
                 logger.info("Configuration loaded successfully")
                 return True
             except ValueError as e:
@@ -167,6 +190,9 @@ class DFM_ConfigManager:
         Raises:
             ValueError: If validation fails after update
         """
+        # In-memory changes no longer match the file on disk
+        self._loaded_mtime = None
+        
         try:
             for key, value in kwargs.items():
                 if hasattr(self._config, key):
@@ -188,3 +214,8 @@ class DFM_ConfigManager:
 
 # Global configuration manager instance
 config_manager = DFM_ConfigManager()
+
+
+def get_config_manager() -> DFM_ConfigManager:
+    """Get the global configuration manager"""
+    return config_manager
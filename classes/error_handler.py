@@ -1,9 +1,11 @@
 """
 Standardized error handling for Difference Engine addon
 """
+import functools
 import logging
+import sys
 import traceback
-from typing import Any, Dict, Optional, Callable, Type
+from typing import Any, Dict, Optional, Callable, Sequence, Tuple, Type
 from enum import Enum
 
 # Setup logging
@@ -30,16 +32,42 @@ class DFM_Error(Exception):
         super().__init__(message)
         self.message = message
         self.error_type = error_type
-        self.details = details or {}
-        self.traceback = traceback.format_exc()
+        # Enum .value goes through a descriptor; resolve it once for formatting
+        self._error_type_value = error_type.value
+        # Subclasses build the dict from their own fields on first access
+        self._details = details
+        # Keep the in-flight exception info; formatting is deferred until requested
+        self._exc_info = sys.exc_info()
+        self._traceback: Optional[str] = None
+    
+    @property
+    def traceback(self) -> str:
+        """Traceback of the exception being handled when this error was created"""
+        if self._traceback is None:
+            self._traceback = ''.join(traceback.format_exception(*self._exc_info))
+        return self._traceback
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        """Additional context about the error"""
+        if self._details is None:
+            self._details = self._build_details()
+        return self._details
+    
+    @details.setter
+    def details(self, value: Optional[Dict[str, Any]]) -> None:
+        self._details = value
+    
+    def _build_details(self) -> Dict[str, Any]:
+        return {}
     
     def __str__(self) -> str:
-        return f"[{self.error_type.value}] {self.message}"
+        return f"[{self._error_type_value}] {self.message}"
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert error to dictionary for logging/serialization"""
         return {
-            'error_type': self.error_type.value,
+            'error_type': self._error_type_value,
             'message': self.message,
             'details': self.details,
             'traceback': self.traceback
@@ -48,32 +76,73 @@ class DFM_Error(Exception):
 
 class DFM_ValidationError(DFM_Error):
     """Raised when input validation fails"""
+    
     def __init__(self, message: str, field: Optional[str] = None, value: Any = None):
-        super().__init__(message, DFM_ErrorType.VALIDATION_ERROR, {'field': field, 'value': value})
+        super().__init__(message, DFM_ErrorType.VALIDATION_ERROR)
+        self.field = field
+        self.value = value
+    
+    def _build_details(self) -> Dict[str, Any]:
+        return {'field': self.field, 'value': self.value}
 
 
 class DFM_FileOperationError(DFM_Error):
     """Raised when file operations fail"""
+    
     def __init__(self, message: str, file_path: Optional[str] = None, operation: Optional[str] = None):
-        super().__init__(message, DFM_ErrorType.FILE_OPERATION_ERROR, {'file_path': file_path, 'operation': operation})
+        super().__init__(message, DFM_ErrorType.FILE_OPERATION_ERROR)
+        self.file_path = file_path
+        self.operation = operation
+    
+    def _build_details(self) -> Dict[str, Any]:
+        return {'file_path': self.file_path, 'operation': self.operation}
 
 
 class DFM_MaterialError(DFM_Error):
     """Raised when material operations fail"""
+    
     def __init__(self, message: str, material_name: Optional[str] = None, operation: Optional[str] = None):
-        super().__init__(message, DFM_ErrorType.MATERIAL_ERROR, {'material_name': material_name, 'operation': operation})
+        super().__init__(message, DFM_ErrorType.MATERIAL_ERROR)
+        self.material_name = material_name
+        self.operation = operation
+    
+    def _build_details(self) -> Dict[str, Any]:
+        return {'material_name': self.material_name, 'operation': self.operation}
 
 
 class DFM_GeometryError(DFM_Error):
     """Raised when geometry operations fail"""
+    
     def __init__(self, message: str, object_name: Optional[str] = None, operation: Optional[str] = None):
-        super().__init__(message, DFM_ErrorType.GEOMETRY_ERROR, {'object_name': object_name, 'operation': operation})
+        super().__init__(message, DFM_ErrorType.GEOMETRY_ERROR)
+        self.object_name = object_name
+        self.operation = operation
+    
+    def _build_details(self) -> Dict[str, Any]:
+        return {'object_name': self.object_name, 'operation': self.operation}
 
 
 class DFM_IndexError(DFM_Error):
     """Raised when index operations fail"""
+    
     def __init__(self, message: str, index_type: Optional[str] = None, operation: Optional[str] = None):
-        super().__init__(message, DFM_ErrorType.INDEX_ERROR, {'index_type': index_type, 'operation': operation})
+        super().__init__(message, DFM_ErrorType.INDEX_ERROR)
+        self.index_type = index_type
+        self.operation = operation
+    
+    def _build_details(self) -> Dict[str, Any]:
+        return {'index_type': self.index_type, 'operation': self.operation}
+
+
+# Sentinel distinguishing a missing parameter from one explicitly set to None
+_MISSING = object()
+
+# Extra log line emitted by handle_operator_error for specific error types
+_ERROR_TYPE_HINTS: Dict[DFM_ErrorType, str] = {
+    DFM_ErrorType.VALIDATION_ERROR: "Validation error occurred - check input parameters",
+    DFM_ErrorType.FILE_OPERATION_ERROR: "File operation failed - check file paths and permissions",
+    DFM_ErrorType.MATERIAL_ERROR: "Material operation failed - check material data integrity",
+}
 
 
 class DFM_ErrorHandler:
@@ -96,34 +165,31 @@ class DFM_ErrorHandler:
         try:
             # Log the error with full context
             error_context = f" in {context}" if context else ""
-            logger.error(f"Operator error{error_context}: {str(error)}")
+            logger.error("Operator error%s: %s", error_context, error)
             
             if isinstance(error, DFM_Error):
                 # Handle our custom errors
-                logger.error(f"Error details: {error.to_dict()}")
+                logger.error("Error details: %s", error.to_dict())
                 
                 # Report to Blender UI
                 operator_instance.report({'ERROR'}, f"{error.error_type.value}: {error.message}")
                 
                 # Log specific error types
-                if error.error_type == DFM_ErrorType.VALIDATION_ERROR:
-                    logger.error("Validation error occurred - check input parameters")
-                elif error.error_type == DFM_ErrorType.FILE_OPERATION_ERROR:
-                    logger.error("File operation failed - check file paths and permissions")
-                elif error.error_type == DFM_ErrorType.MATERIAL_ERROR:
-                    logger.error("Material operation failed - check material data integrity")
+                hint = _ERROR_TYPE_HINTS.get(error.error_type)
+                if hint:
+                    logger.error(hint)
                 
             else:
                 # Handle generic exceptions
-                logger.error(f"Unexpected error: {traceback.format_exc()}")
+                logger.error("Unexpected error", exc_info=error)
                 operator_instance.report({'ERROR'}, f"Unexpected error: {str(error)}")
             
             return {'CANCELLED'}
             
         except Exception as handler_error:
             # If error handling itself fails, log and return generic error
-            logger.critical(f"Error handler failed: {handler_error}")
-            logger.critical(f"Original error: {error}")
+            logger.critical("Error handler failed: %s", handler_error)
+            logger.critical("Original error: %s", error)
             operator_instance.report({'ERROR'}, "An unexpected error occurred")
             return {'CANCELLED'}
     
@@ -140,25 +206,28 @@ class DFM_ErrorHandler:
         """
         try:
             error_context = f" in {context}" if context else ""
-            logger.error(f"Function '{function_name}' error{error_context}: {str(error)}")
+            logger.error("Function '%s' error%s: %s", function_name, error_context, error)
             
             if isinstance(error, DFM_Error):
-                logger.error(f"Error details: {error.to_dict()}")
+                logger.error("Error details: %s", error.to_dict())
             else:
-                logger.error(f"Unexpected error in {function_name}: {traceback.format_exc()}")
+                logger.error("Unexpected error in %s", function_name, exc_info=error)
                 
         except Exception as handler_error:
-            logger.critical(f"Error handler failed for function '{function_name}': {handler_error}")
-            logger.critical(f"Original error: {error}")
+            logger.critical("Error handler failed for function '%s': %s", function_name, handler_error)
+            logger.critical("Original error: %s", error)
     
     @staticmethod
-    def safe_execute(func: Callable, *args, **kwargs) -> tuple[Any, Optional[Exception]]:
+    def safe_execute(func: Callable, *args,
+                     exc_types: Tuple[Type[BaseException], ...] = (Exception,),
+                     **kwargs) -> tuple[Any, Optional[Exception]]:
         """
         Safely execute a function and return result with any exception.
         
         Args:
             func: Function to execute
             *args: Positional arguments for the function
+            exc_types: Exception types to catch; anything else propagates
             **kwargs: Keyword arguments for the function
             
         Returns:
@@ -167,46 +236,53 @@ class DFM_ErrorHandler:
         try:
             result = func(*args, **kwargs)
             return result, None
-        except Exception as e:
+        except exc_types as e:
             DFM_ErrorHandler.handle_function_error(func.__name__, e)
             return None, e
     
     @staticmethod
-    def validate_required_params(params: Dict[str, Any], required_keys: list[str]) -> None:
+    def validate_required_params(params: Dict[str, Any], required_keys: Sequence[str]) -> None:
         """
         Validate that required parameters are present and not None.
         
         Args:
             params: Dictionary of parameters to validate
-            required_keys: List of required parameter keys
+            required_keys: Required parameter keys, ideally a module-level tuple
             
         Raises:
             DFM_ValidationError: If required parameters are missing or None
         """
         for key in required_keys:
-            if key not in params:
+            value = params.get(key, _MISSING)
+            if value is _MISSING:
                 raise DFM_ValidationError(f"Required parameter '{key}' is missing", field=key)
             
-            if params[key] is None:
+            if value is None:
                 raise DFM_ValidationError(f"Required parameter '{key}' cannot be None", field=key, value=None)
     
     @staticmethod
     def log_operation_start(operation: str, details: Optional[Dict[str, Any]] = None) -> None:
         """Log the start of an operation for debugging."""
-        detail_str = f" - {details}" if details else ""
-        logger.info(f"Starting operation: {operation}{detail_str}")
+        if details:
+            logger.info("Starting operation: %s - %s", operation, details)
+        else:
+            logger.info("Starting operation: %s", operation)
     
     @staticmethod
     def log_operation_success(operation: str, details: Optional[Dict[str, Any]] = None) -> None:
         """Log successful completion of an operation."""
-        detail_str = f" - {details}" if details else ""
-        logger.info(f"Operation completed successfully: {operation}{detail_str}")
+        if details:
+            logger.info("Operation completed successfully: %s - %s", operation, details)
+        else:
+            logger.info("Operation completed successfully: %s", operation)
     
     @staticmethod
     def log_operation_failure(operation: str, error: Exception, details: Optional[Dict[str, Any]] = None) -> None:
         """Log failure of an operation."""
-        detail_str = f" - {details}" if details else ""
-        logger.error(f"Operation failed: {operation}{detail_str} - {str(error)}")
+        if details:
+            logger.error("Operation failed: %s - %s - %s", operation, details, error)
+        else:
+            logger.error("Operation failed: %s - %s", operation, error)
 
 
 def error_handler_decorator(error_type: DFM_ErrorType = DFM_ErrorType.UNKNOWN_ERROR):
@@ -217,18 +293,24 @@ def error_handler_decorator(error_type: DFM_ErrorType = DFM_ErrorType.UNKNOWN_ER
         error_type: Type of error to raise if function fails
     """
     def decorator(func: Callable) -> Callable:
+        name = func.__name__
+
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
             try:
-                DFM_ErrorHandler.log_operation_start(func.__name__)
+                # Checked per call (logging caches it) so later level changes apply
+                if not logger.isEnabledFor(logging.INFO):
+                    return func(*args, **kwargs)
+                DFM_ErrorHandler.log_operation_start(name)
                 result = func(*args, **kwargs)
-                DFM_ErrorHandler.log_operation_success(func.__name__)
+                DFM_ErrorHandler.log_operation_success(name)
                 return result
             except DFM_Error:
                 # Re-raise our custom errors
                 raise
             except Exception as e:
                 # Wrap generic exceptions
-                DFM_ErrorHandler.log_operation_failure(func.__name__, e)
-                raise DFM_Error(f"Error in {func.__name__}: {str(e)}", error_type) from e
+                DFM_ErrorHandler.log_operation_failure(name, e)
+                raise DFM_Error(f"Error in {name}: {str(e)}", error_type) from e
         return wrapper
     return decorator
@@ -2,17 +2,66 @@
 Material and texture export functionality
 """
 import bpy
-import json
+import functools
 import os
 import shutil
 import logging
-from typing import Optional, Dict, Any, List, Union, Tuple
-from .utils import convert_to_json_serializable, validate_file_path, validate_directory_path, is_safe_file_extension
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, List, Union, Tuple, Callable
+from .utils import convert_to_json_serializable, validate_file_path, validate_directory_path, json_dumps, _SAFE_FILE_EXTENSIONS
 from .error_handler import DFM_ErrorHandler, DFM_Error, DFM_ErrorType, error_handler_decorator
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Socket types whose default_value is a float array or a plain number
+_ARRAY_SOCKET_TYPES = frozenset({'VECTOR', 'RGBA'})
+_SCALAR_SOCKET_TYPES = frozenset({'VALUE', 'INT', 'BOOLEAN'})
+
+# Optional node attributes exported as-is into node_data["properties"]
+_NODE_PROP_ATTRS = (
+    'operation',      # Math, VectorMath, etc.
+    'blend_type',     # Mix nodes
+    'interpolation',  # Image Texture
+    'extension',      # Image Texture
+    'color_space',    # Image Texture
+    'label',
+    'hide',
+    'mute',
+)
+_MISSING = object()
+
+# Image file extensions (without the dot) that textures are copied or saved with;
+# derived from the safe extension list so both stay in step
+_IMAGE_EXTENSIONS = frozenset(ext[1:] for ext in _SAFE_FILE_EXTENSIONS if ext != '.json')
+
+
+def _has_image_extension(file_name: str) -> bool:
+    """Check the extension against _IMAGE_EXTENSIONS without building a Path"""
+    _, dot, ext = file_name.rpartition('.')
+    return bool(dot) and ext.lower() in _IMAGE_EXTENSIONS
+
+
+# Logger the DFM_ErrorHandler.log_operation_* helpers write to
+_operation_logger = logging.getLogger(DFM_ErrorHandler.__module__)
+
+
+@contextmanager
+def _op(operation: str, get_details: Callable[[], Dict[str, Any]],
+        get_success_details: Optional[Callable[[], Dict[str, Any]]] = None):
+    """Log start/success/failure of an operation, building details only when logged"""
+    log_info = _operation_logger.isEnabledFor(logging.INFO)
+    if log_info:
+        DFM_ErrorHandler.log_operation_start(operation, get_details())
+    try:
+        yield
+    except Exception as e:
+        DFM_ErrorHandler.log_operation_failure(operation, e, get_details())
+        raise
+    if log_info:
+        DFM_ErrorHandler.log_operation_success(
+            operation, (get_success_details or get_details)())
+
 
 class DFM_MaterialExporter:
     """Class for exporting materials and textures"""
@@ -66,31 +115,31 @@ class DFM_MaterialExporter:
             - External textures are copied with their original format
             - Node groups are referenced by name (must exist in target blend file)
         """
-        DFM_ErrorHandler.log_operation_start("export_material", {
-            'material_name': material.name if material else 'None',
-            'export_path': export_path
-        })
-        
-        # Validate inputs
-        if not material:
-            raise DFM_Error("Material cannot be None", DFM_ErrorType.VALIDATION_ERROR)
-        
-        if not export_path:
-            raise DFM_Error("Export path cannot be empty", DFM_ErrorType.VALIDATION_ERROR)
-        
-        # Validate export path (allow absolute paths for export operations)
-        if not validate_directory_path(export_path, create_if_missing=True, allow_absolute=True):
-            raise DFM_Error(f"Invalid export path: {export_path}", DFM_ErrorType.FILE_OPERATION_ERROR)
-        
-        try:
+        with _op("export_material",
+                 lambda: {'material_name': material.name if material else 'None',
+                          'export_path': export_path},
+                 lambda: {'material_name': material.name,
+                          'file': os.path.basename(material_file)}):
+            # Validate inputs
+            if not material:
+                raise DFM_Error("Material cannot be None", DFM_ErrorType.VALIDATION_ERROR)
+            
+            if not export_path:
+                raise DFM_Error("Export path cannot be empty", DFM_ErrorType.VALIDATION_ERROR)
+            
+            # Validate export path (allow absolute paths for export operations)
+            if not validate_directory_path(export_path, create_if_missing=True, allow_absolute=True):
+                raise DFM_Error(f"Invalid export path: {export_path}", DFM_ErrorType.FILE_OPERATION_ERROR)
+            
+            use_nodes = material.use_nodes
             material_data = {
                 "name": material.name,
-                "type": material.use_nodes and "NODES" or "SURFACE",
+                "type": "NODES" if use_nodes else "SURFACE",
                 "diffuse_color": list(material.diffuse_color[:4]),  # RGBA as list
                 "specular_color": list(material.specular_color[:3]),  # RGB as list
                 "roughness": float(material.roughness),
                 "metallic": float(material.metallic),
-                "use_nodes": material.use_nodes
+                "use_nodes": use_nodes
             }
             
             # Create textures directory (allow absolute paths)
@@ -99,8 +148,9 @@ class DFM_MaterialExporter:
                 raise DFM_Error(f"Failed to create textures directory: {textures_dir}", DFM_ErrorType.FILE_OPERATION_ERROR)
             
             # Export node-based materials
-            if material.use_nodes and material.node_tree:
-                node_tree_data = DFM_MaterialExporter.export_node_tree(material.node_tree, textures_dir)
+            node_tree = material.node_tree if use_nodes else None
+            if node_tree:
+                node_tree_data = DFM_MaterialExporter.export_node_tree(node_tree, textures_dir)
                 material_data["nodes"] = node_tree_data.get("nodes", [])
                 material_data["links"] = node_tree_data.get("links", [])
             
@@ -111,22 +161,10 @@ class DFM_MaterialExporter:
             if not validate_file_path(material_file, allow_absolute=True):
                 raise DFM_Error(f"Invalid material file path: {material_file}", DFM_ErrorType.FILE_OPERATION_ERROR)
             
-            with open(material_file, 'w') as f:
-                json.dump(material_data, f)
-            
-            DFM_ErrorHandler.log_operation_success("export_material", {
-                'material_name': material.name,
-                'file': os.path.basename(material_file)
-            })
-            
-            return os.path.basename(material_file)
-            
-        except Exception as e:
-            DFM_ErrorHandler.log_operation_failure("export_material", e, {
-                'material_name': material.name,
-                'export_path': export_path
-            })
-            raise
+            with open(material_file, 'wb') as f:
+                f.write(json_dumps(material_data))
+        
+        return os.path.basename(material_file)
     
     @staticmethod
     @error_handler_decorator(DFM_ErrorType.MATERIAL_ERROR)
@@ -145,121 +183,118 @@ class DFM_MaterialExporter:
             DFM_ValidationError: If input parameters are invalid
             DFM_MaterialError: If node tree export fails
         """
-        DFM_ErrorHandler.log_operation_start("export_node_tree", {
-            'node_tree_name': node_tree.name if node_tree else 'None',
-            'textures_dir': textures_dir
-        })
-        
-        # Validate inputs
-        if not node_tree:
-            raise DFM_Error("Node tree cannot be None", DFM_ErrorType.VALIDATION_ERROR)
-        
-        if not textures_dir:
-            raise DFM_Error("Textures directory cannot be empty", DFM_ErrorType.VALIDATION_ERROR)
-        
-        try:
+        with _op("export_node_tree",
+                 lambda: {'node_tree_name': node_tree.name if node_tree else 'None',
+                          'textures_dir': textures_dir},
+                 lambda: {'node_tree_name': node_tree.name,
+                          'nodes_count': len(nodes_data),
+                          'links_count': len(links_data)}):
+            # Validate inputs
+            if not node_tree:
+                raise DFM_Error("Node tree cannot be None", DFM_ErrorType.VALIDATION_ERROR)
+            
+            if not textures_dir:
+                raise DFM_Error("Textures directory cannot be empty", DFM_ErrorType.VALIDATION_ERROR)
+            
             nodes_data = []
+            # Texture copies made so far, keyed by image name, so shared images are written once
+            copied_images: Dict[str, Tuple[str, bool]] = {}
+            type_exporters = dict(_NODE_TYPE_EXPORTERS)
+            type_exporters['TEX_IMAGE'] = functools.partial(
+                DFM_MaterialExporter._export_image_texture,
+                textures_dir=textures_dir, copied_images=copied_images)
             
             for node in node_tree.nodes:
+                # Each RNA attribute access is a C call; read location once
+                location = node.location
+                node_name = node.name
+                
+                # Export common node properties with validation
+                properties = DFM_MaterialExporter._export_node_properties(node)
+                
                 node_data = {
-                    "name": node.name,
+                    "name": node_name,
                     "type": node.type,
-                    "location": [float(node.location.x), float(node.location.y)],  # 2D vector [X, Y]
+                    "location": [float(location.x), float(location.y)],  # 2D vector [X, Y]
                     "width": float(node.width),
-                    "inputs": [],
-                    "outputs": [],
-                    "properties": {}  # Additional node-specific properties
+                    "properties": properties  # Additional node-specific properties
                 }
                 
-                # Export common node properties with validation
-                DFM_MaterialExporter._export_node_properties(node, node_data)
-                
-                # Export Node Group reference
-                if node.type == 'GROUP' and hasattr(node, 'node_tree') and node.node_tree:
-                    node_data["properties"]["node_tree_name"] = node.node_tree.name
-                    logger.debug(f"Exporting Group node referencing: {node.node_tree.name}")
+                # Export type-specific data (group reference, color ramp, curves, image texture)
+                type_exporter = type_exporters.get(node_data["type"])
+                if type_exporter is not None:
+                    type_exporter(node, node_data)
                 
-                # Export ColorRamp (ValToRGB) data
-                if node.type == 'VALTORGB' and hasattr(node, 'color_ramp'):
-                    DFM_MaterialExporter._export_color_ramp(node, node_data)
-                
-                # Export Curve data (Float, RGB, Vector curves)
-                if node.type in ('CURVE_FLOAT', 'CURVE_RGB', 'CURVE_VEC'):
-                    DFM_MaterialExporter._export_curve_data(node, node_data)
-                
-                # Handle image texture nodes with enhanced validation
-                if node.type == 'TEX_IMAGE' and node.image:
-                    DFM_MaterialExporter._export_image_texture(node, node_data, textures_dir)
+                # Empty containers are omitted; the importer treats missing keys as empty
+                if not properties:
+                    del node_data["properties"]
                 
                 # Export input sockets with validation
-                DFM_MaterialExporter._export_input_sockets(node, node_data)
+                inputs = DFM_MaterialExporter._export_input_sockets(node.inputs, node_name)
+                if inputs:
+                    node_data["inputs"] = inputs
                 
                 # Export output sockets
-                DFM_MaterialExporter._export_output_sockets(node, node_data)
+                outputs = DFM_MaterialExporter._export_output_sockets(node.outputs, node_name)
+                if outputs:
+                    node_data["outputs"] = outputs
                 
                 nodes_data.append(node_data)
             
             # Export node links (connections between nodes)
             links_data = DFM_MaterialExporter._export_node_links(node_tree)
-            
-            result = {"nodes": nodes_data, "links": links_data}
-            
-            DFM_ErrorHandler.log_operation_success("export_node_tree", {
-                'node_tree_name': node_tree.name,
-                'nodes_count': len(nodes_data),
-                'links_count': len(links_data)
-            })
-            
-            return result
-            
-        except Exception as e:
-            DFM_ErrorHandler.log_operation_failure("export_node_tree", e, {
-                'node_tree_name': node_tree.name if node_tree else 'None'
-            })
-            raise
+        
+        return {"nodes": nodes_data, "links": links_data}
     
     @staticmethod
-    def _export_node_properties(node: bpy.types.Node, node_data: Dict[str, Any]) -> None:
+    def _export_node_properties(node: bpy.types.Node) -> Dict[str, Any]:
         """Export common node properties with validation"""
+        properties = {}
         try:
-            if hasattr(node, 'operation'):  # Math, VectorMath, etc.
-                node_data["properties"]["operation"] = node.operation
-            if hasattr(node, 'blend_type'):  # Mix nodes
-                node_data["properties"]["blend_type"] = node.blend_type
-            if hasattr(node, 'interpolation'):  # Image Texture
-                node_data["properties"]["interpolation"] = node.interpolation
-            if hasattr(node, 'extension'):  # Image Texture
-                node_data["properties"]["extension"] = node.extension
-            if hasattr(node, 'color_space'):  # Image Texture
-                node_data["properties"]["color_space"] = node.color_space
-            if hasattr(node, 'label'):
-                node_data["properties"]["label"] = node.label
-            if hasattr(node, 'hide'):
-                node_data["properties"]["hide"] = node.hide
-            if hasattr(node, 'mute'):
-                node_data["properties"]["mute"] = node.mute
+            for attr in _NODE_PROP_ATTRS:
+                value = getattr(node, attr, _MISSING)
+                if value is not _MISSING:
+                    properties[attr] = value
         except Exception as e:
-            logger.warning(f"Failed to export properties for node {node.name}: {e}")
+            logger.warning("Failed to export properties for node %s: %s", node.name, e)
+        return properties
+    
+    @staticmethod
+    def _export_group_reference(node: bpy.types.Node, node_data: Dict[str, Any]) -> None:
+        """Export the node group referenced by a Group node"""
+        node_group = getattr(node, 'node_tree', None)
+        if node_group:
+            node_data["properties"]["node_tree_name"] = node_group.name
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Exporting Group node referencing: %s", node_group.name)
     
     @staticmethod
     def _export_color_ramp(node: bpy.types.Node, node_data: Dict[str, Any]) -> None:
         """Export ColorRamp data with validation"""
+        ramp = getattr(node, 'color_ramp', None)
+        if ramp is None:
+            return
         try:
-            ramp = node.color_ramp
+            elements = ramp.elements
+            count = len(elements)
+            
+            # Bulk-read positions and flattened RGBA colors in one call each
+            positions = [0.0] * count
+            colors = [0.0] * (count * 4)
+            elements.foreach_get("position", positions)
+            elements.foreach_get("color", colors)
+            
             ramp_data = {
                 "color_mode": ramp.color_mode,
                 "interpolation": ramp.interpolation,
-                "elements": []
+                "elements": [
+                    {"position": positions[i], "color": colors[i * 4:i * 4 + 4]}
+                    for i in range(count)
+                ]
             }
-            for element in ramp.elements:
-                ramp_data["elements"].append({
-                    "position": float(element.position),
-                    "color": [float(element.color[0]), float(element.color[1]), 
-                             float(element.color[2]), float(element.color[3])]
-                })
             node_data["properties"]["color_ramp"] = ramp_data
         except Exception as e:
-            logger.warning(f"Failed to export color ramp for node {node.name}: {e}")
+            logger.warning("Failed to export color ramp for node %s: %s", node.name, e)
     
     @staticmethod
     def _export_curve_data(node: bpy.types.Node, node_data: Dict[str, Any]) -> None:
@@ -272,133 +307,172 @@ class DFM_MaterialExporter:
                     "curves": []
                 }
                 for curve in mapping.curves:
-                    curve_points = []
-                    for point in curve.points:
-                        curve_points.append({
-                            "location": [float(point.location[0]), float(point.location[1])],
-                            "handle_type": point.handle_type
-                        })
-                    curves_data["curves"].append(curve_points)
+                    points = curve.points
+                    # Locations are bulk-read; enum handle types still need per-point access
+                    locations = [0.0] * (len(points) * 2)
+                    points.foreach_get("location", locations)
+                    curves_data["curves"].append([
+                        {"location": locations[i * 2:i * 2 + 2], "handle_type": point.handle_type}
+                        for i, point in enumerate(points)
+                    ])
                 node_data["properties"]["mapping"] = curves_data
         except Exception as e:
-            logger.warning(f"Failed to export curve data for node {node.name}: {e}")
+            logger.warning("Failed to export curve data for node %s: %s", node.name, e)
     
     @staticmethod
-    def _export_image_texture(node: bpy.types.Node, node_data: Dict[str, Any], textures_dir: str) -> None:
+    def _export_image_texture(node: bpy.types.Node, node_data: Dict[str, Any], textures_dir: str,
+                              copied_images: Optional[Dict[str, Tuple[str, bool]]] = None) -> None:
         """Export image texture with enhanced validation"""
         try:
-            node_data["image"] = node.image.name
-            node_data["image_file"] = node.image.filepath
+            # Read the image datablock and its path once; each access crosses into RNA
+            image = node.image
+            if not image:
+                return
+            image_path = image.filepath
+            node_data["image"] = image.name
+            node_data["image_file"] = image_path
+            
+            # Reuse an earlier copy of the same image; copied_images maps
+            # image names to their (copied_texture, was_packed) result
+            image_key = image.name_full
+            if copied_images is not None and image_key in copied_images:
+                node_data["copied_texture"], node_data["was_packed"] = copied_images[image_key]
+                return
             
             # Handle packed images
-            if node.image.packed_file:
+            if image.packed_file:
                 # Save packed image to textures directory
-                image_filename = node.image.name
-                if not image_filename.lower().endswith(('.png', '.jpg', '.jpeg', '.tga', '.bmp', '.exr')):
+                image_filename = image.name
+                if not _has_image_extension(image_filename):
                     image_filename += '.png'
                 
                 dest_path = os.path.join(textures_dir, image_filename)
                 
                 # Validate destination path (allow absolute paths)
                 if not validate_file_path(dest_path, allow_absolute=True):
-                    logger.warning(f"Invalid destination path for packed image: {dest_path}")
+                    logger.warning("Invalid destination path for packed image: %s", dest_path)
                     return
                 
                 # Save packed image directly to destination
                 try:
-                    node.image.save(dest_path)
+                    image.save(dest_path)
                 except TypeError:
                     # Fallback for older API signatures
-                    node.image.save(filepath=dest_path)
+                    image.save(filepath=dest_path)
                 node_data["copied_texture"] = image_filename
                 node_data["was_packed"] = True
+                if copied_images is not None:
+                    copied_images[image_key] = (image_filename, True)
                 
             # Copy texture file from disk
-            elif node.image.filepath and os.path.exists(bpy.path.abspath(node.image.filepath)):
-                source_path = bpy.path.abspath(node.image.filepath)
+            elif image_path:
+                source_path = bpy.path.abspath(image_path)
                 
-                # Validate source path (allow absolute paths)
-                if not validate_file_path(source_path, must_exist=True, must_be_file=True, allow_absolute=True):
-                    logger.warning(f"Invalid source path for image: {source_path}")
+                # One stat covers both existence and file type; missing images are skipped silently
+                if not os.path.isfile(source_path):
                     return
                 
                 # Check file extension safety
-                if not is_safe_file_extension(source_path):
-                    logger.warning(f"Unsafe file extension for image: {source_path}")
+                if not _has_image_extension(source_path):
+                    logger.warning("Unsafe file extension for image: %s", source_path)
+                    return
+                
+                # Validate source path (allow absolute paths)
+                if not validate_file_path(source_path, allow_absolute=True):
+                    logger.warning("Invalid source path for image: %s", source_path)
                     return
                 
-                dest_path = os.path.join(textures_dir, os.path.basename(node.image.filepath))
+                image_filename = os.path.basename(image_path)
+                dest_path = os.path.join(textures_dir, image_filename)
                 
                 # Validate destination path (allow absolute paths)
                 if not validate_file_path(dest_path, allow_absolute=True):
-                    logger.warning(f"Invalid destination path for image: {dest_path}")
+                    logger.warning("Invalid destination path for image: %s", dest_path)
                     return
                 
                 shutil.copy2(source_path, dest_path)
-                node_data["copied_texture"] = os.path.basename(dest_path)
+                node_data["copied_texture"] = image_filename
                 node_data["was_packed"] = False
+                if copied_images is not None:
+                    copied_images[image_key] = (image_filename, False)
                 
         except Exception as e:
-            logger.warning(f"Failed to export image texture for node {node.name}: {e}")
+            logger.warning("Failed to export image texture for node %s: %s", node.name, e)
     
     @staticmethod
-    def _export_input_sockets(node: bpy.types.Node, node_data: Dict[str, Any]) -> None:
+    def _export_input_sockets(inputs: bpy.types.NodeInputs, node_name: str) -> List[Dict[str, Any]]:
         """Export input sockets with validation"""
+        inputs_data = []
         try:
-            for input_socket in node.inputs:
+            for input_socket in inputs:
+                socket_type = input_socket.type
                 # Handle default_value which might be a Blender type (Vector, Color, etc.)
                 default_val = getattr(input_socket, 'default_value', None)
                 
-                # Convert default values safely
+                # Convert default values safely; common socket types skip the probing below
                 safe_default = None
                 if default_val is not None:
-                    try:
-                        # Try to convert to list (works for Vector, Color, etc.)
-                        if hasattr(default_val, '__len__'):
-                            safe_default = [float(v) for v in default_val]
-                        else:
-                            # Single value (float, int, bool)
-                            safe_default = float(default_val) if isinstance(default_val, (int, float)) else default_val
-                    except (TypeError, ValueError):
-                        safe_default = None
+                    if socket_type in _ARRAY_SOCKET_TYPES:
+                        # Float arrays already yield Python floats
+                        safe_default = list(default_val)
+                    elif socket_type in _SCALAR_SOCKET_TYPES:
+                        safe_default = float(default_val)
+                    else:
+                        try:
+                            # Try to convert to list (works for Vector, Color, etc.)
+                            if hasattr(default_val, '__len__'):
+                                safe_default = [float(v) for v in default_val]
+                            else:
+                                # Single value (float, int, bool)
+                                safe_default = float(default_val) if isinstance(default_val, (int, float)) else default_val
+                        except (TypeError, ValueError):
+                            safe_default = None
                 
-                input_data = {
+                inputs_data.append({
                     "name": input_socket.name,
-                    "type": input_socket.type,
+                    "type": socket_type,
                     "default_value": safe_default
-                }
-                node_data["inputs"].append(input_data)
+                })
         except Exception as e:
-            logger.warning(f"Failed to export input sockets for node {node.name}: {e}")
+            logger.warning("Failed to export input sockets for node %s: %s", node_name, e)
+        return inputs_data
     
     @staticmethod
-    def _export_output_sockets(node: bpy.types.Node, node_data: Dict[str, Any]) -> None:
+    def _export_output_sockets(outputs: bpy.types.NodeOutputs, node_name: str) -> List[Dict[str, str]]:
         """Export output sockets"""
+        outputs_data = []
         try:
-            for output_socket in node.outputs:
-                output_data = {
-                    "name": output_socket.name,
-                    "type": output_socket.type
-                }
-                node_data["outputs"].append(output_data)
+            outputs_data.extend(
+                {"name": output_socket.name, "type": output_socket.type}
+                for output_socket in outputs
+            )
         except Exception as e:
-            logger.warning(f"Failed to export output sockets for node {node.name}: {e}")
+            logger.warning("Failed to export output sockets for node %s: %s", node_name, e)
+        return outputs_data
     
     @staticmethod
     def _export_node_links(node_tree: bpy.types.NodeTree) -> List[Dict[str, str]]:
         """Export node links with validation"""
-        links_data = []
         try:
-            for link in node_tree.links:
-                link_data = {
+            return [
+                {
                     "from_node": link.from_node.name,
                     "from_socket": link.from_socket.name,
                     "to_node": link.to_node.name,
                     "to_socket": link.to_socket.name
                 }
-                links_data.append(link_data)
+                for link in node_tree.links
+            ]
         except Exception as e:
-            logger.warning(f"Failed to export node links: {e}")
-        
-        return links_data
+            logger.warning("Failed to export node links: %s", e)
+            return []
+
 
+# Node type -> exporter for type-specific data; TEX_IMAGE is bound per node tree
+_NODE_TYPE_EXPORTERS = {
+    'GROUP': DFM_MaterialExporter._export_group_reference,
+    'VALTORGB': DFM_MaterialExporter._export_color_ramp,
+    'CURVE_FLOAT': DFM_MaterialExporter._export_curve_data,
+    'CURVE_RGB': DFM_MaterialExporter._export_curve_data,
+    'CURVE_VEC': DFM_MaterialExporter._export_curve_data,
+}
@@ -2,14 +2,63 @@
 Material and texture import functionality
 """
 import bpy
-import json
+import functools
 import os
 import logging
 from typing import Optional, Dict, Any, List, Union, Tuple
+from .utils import json_loads
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Node properties restored with a plain setattr; nodes lacking one are skipped
+_SIMPLE_NODE_PROPS = (
+    'operation',
+    'blend_type',
+    'interpolation',
+    'extension',
+    'color_space',
+    'label',
+    'hide',
+    'mute',
+)
+
+# Images loaded by import_node_tree, keyed by texture path, with the file's
+# mtime at load time; unchanged textures are reused without a reload. Images
+# are stored by name and looked up again in bpy.data.images, since undo and
+# file loads invalidate Python references to datablocks
+_texture_cache: Dict[str, Tuple[int, str]] = {}
+
+# Absolute tolerance for _values_equal; stored socket values are float32
+_VALUE_TOLERANCE = 1e-7
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_node_type(original_type: str) -> str:
+    """Convert an exported node type (e.g. BSDF_PRINCIPLED) to its node class name"""
+    if original_type.startswith('ShaderNode'):
+        # Already in correct format
+        return original_type
+    mapped_type = DFM_MaterialImporter.NODE_TYPE_MAP.get(original_type)
+    if mapped_type is not None:
+        # Use explicit mapping for special cases
+        return mapped_type
+    # Convert using simple pattern: BSDF_PRINCIPLED → ShaderNodeBsdfPrincipled
+    return 'ShaderNode' + ''.join(word.capitalize() for word in original_type.split('_'))
+
+
+def _values_equal(current: Any, value: Any) -> bool:
+    """Compare a socket's current default_value with an imported one, within float32 precision"""
+    if current is None:
+        return False
+    try:
+        if isinstance(value, (list, tuple)):
+            return len(current) == len(value) and all(
+                abs(a - b) <= _VALUE_TOLERANCE for a, b in zip(current, value))
+        return abs(current - value) <= _VALUE_TOLERANCE
+    except TypeError:
+        return current == value
+
 
 class DFM_MaterialImporter:
     """Class for importing materials and textures"""
@@ -79,13 +128,14 @@ class DFM_MaterialImporter:
         """
         try:
             logger.info(f"Importing material from: {material_file}")
-            with open(material_file, 'r') as f:
-                material_data = json.load(f)
+            with open(material_file, 'rb') as f:
+                material_data = json_loads(f.read())
             
-            logger.debug(f"Material data keys: {material_data.keys()}")
-            logger.debug(f"use_nodes: {material_data.get('use_nodes')}")
-            logger.debug(f"nodes count: {len(material_data.get('nodes', []))}")
-            logger.debug(f"links count: {len(material_data.get('links', []))}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Material data keys: {material_data.keys()}")
+                logger.debug(f"use_nodes: {material_data.get('use_nodes')}")
+                logger.debug(f"nodes count: {len(material_data.get('nodes', []))}")
+                logger.debug(f"links count: {len(material_data.get('links', []))}")
             
             # Create material with tmp_ prefix for imported materials
             original_name = material_data.get('name', 'ImportedMaterial')
@@ -151,6 +201,9 @@ class DFM_MaterialImporter:
             links_data: List of link data dictionaries
             import_path: Base path for texture files
         """
+        # Per-node debug messages read RNA names; skip building them when debug is off
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        
         # Clear existing nodes
         node_tree.nodes.clear()
         
@@ -158,31 +211,23 @@ class DFM_MaterialImporter:
         created_nodes = {}
         
         textures_dir = os.path.join(import_path, "textures")
+        # Files in textures_dir, listed once on the first image node
+        texture_paths = None
         
         for node_data in nodes_data:
             # Create node with proper type conversion
             original_type = node_data.get('type', 'BSDF_PRINCIPLED')
             
-            logger.debug(f"Processing node: {node_data.get('name', 'unnamed')} of type: {original_type}")
+            if debug_enabled:
+                logger.debug(f"Processing node: {node_data.get('name', 'unnamed')} of type: {original_type}")
             
-            # Convert node type from internal format to class name
-            if original_type.startswith('ShaderNode'):
-                # Already in correct format
-                node_type = original_type
-            elif original_type in DFM_MaterialImporter.NODE_TYPE_MAP:
-                # Use explicit mapping for special cases
-                node_type = DFM_MaterialImporter.NODE_TYPE_MAP[original_type]
-                logger.debug(f"Mapped {original_type} → {node_type}")
-            else:
-                # Convert using simple pattern: BSDF_PRINCIPLED → ShaderNodeBsdfPrincipled
-                parts = original_type.split('_')
-                formatted_name = ''.join(word.capitalize() for word in parts)
-                node_type = f'ShaderNode{formatted_name}'
-                logger.debug(f"Converted {original_type} → {node_type}")
+            # Convert node type from internal format to class name (cached per type)
+            node_type = _resolve_node_type(original_type)
             
             try:
                 node = node_tree.nodes.new(type=node_type)
-                logger.debug(f"✓ Created node: {node.name}")
+                if debug_enabled:
+                    logger.debug(f"✓ Created node: {node.name}")
             except Exception as e:
                 logger.error(f"✗ Failed to create node type '{node_type}' (from '{original_type}'): {e}")
                 logger.error(f"  Hint: Add mapping for '{original_type}' in NODE_TYPE_MAP")
@@ -217,10 +262,15 @@ class DFM_MaterialImporter:
                     # Also consider original absolute/relative path as a last resort
                     candidate_paths.append(bpy.path.abspath(image_file_original))
                 
-                # Resolve first existing path
+                # Resolve first existing path; textures_dir entries come from one directory
+                # scan, anything else (including case-only mismatches) from os.path.exists
+                if texture_paths is None:
+                    texture_paths = DFM_MaterialImporter._list_texture_files(textures_dir)
                 resolved_path = None
                 for candidate in candidate_paths:
-                    if candidate and isinstance(candidate, str) and os.path.exists(candidate):
+                    if not candidate or not isinstance(candidate, str):
+                        continue
+                    if os.path.normcase(candidate) in texture_paths or os.path.exists(candidate):
                         resolved_path = candidate
                         break
                 
@@ -232,29 +282,33 @@ class DFM_MaterialImporter:
                     )
                 else:
                     try:
-                        file_size_mb = os.path.getsize(resolved_path) / (1024 * 1024)
+                        stat_result = os.stat(resolved_path)
+                        file_size_mb = stat_result.st_size / (1024 * 1024)
                         if file_size_mb > 50:
                             logger.warning(f"Loading large texture: {os.path.basename(resolved_path)} ({file_size_mb:.1f} MB)")
                         
-                        # Reuse cached image by filename when possible
-                        cached_name = os.path.basename(resolved_path)
-                        image = bpy.data.images.get(cached_name)
-                        if image:
-                            logger.debug(f"Reusing cached texture: {cached_name}")
-                            image.filepath = resolved_path
-                            # Force reload to ensure up-to-date display
-                            image.reload()
-                        else:
-                            image = bpy.data.images.load(resolved_path)
-                            logger.debug(f"Loaded new texture from {resolved_path}")
+                        image = DFM_MaterialImporter._get_cached_texture(resolved_path, stat_result.st_mtime_ns)
+                        if image is None:
+                            # Blender returns an image already loaded from the same file instead of a duplicate
+                            images = bpy.data.images
+                            image_count = len(images)
+                            image = images.load(resolved_path, check_existing=True)
+                            if len(images) == image_count:
+                                # Existing image the cache knew nothing about; the file may have changed
+                                image.reload()
+                            if debug_enabled:
+                                logger.debug(f"Loaded texture from {resolved_path}")
+                        _texture_cache[resolved_path] = (stat_result.st_mtime_ns, image.name_full)
                         
                         # Assign image to node
                         if hasattr(node, 'image'):
                             node.image = image
-                            logger.debug(
-                                f"✓ Assigned texture {cached_name} to node {node.name} | "
-                                f"{image.size[0]}x{image.size[1]}"
-                            )
+                            # Reading image.size loads the pixels; keep that out of non-debug imports
+                            if debug_enabled:
+                                logger.debug(
+                                    f"✓ Assigned texture {image.name} to node {node.name} | "
+                                    f"{image.size[0]}x{image.size[1]}"
+                                )
                         else:
                             logger.error(f"✗ Node {node.name} doesn't have 'image' attribute!")
                     except Exception as e:
@@ -266,32 +320,17 @@ class DFM_MaterialImporter:
             if 'properties' in node_data:
                 props = node_data['properties']
                 
-                # Common properties
-                if 'operation' in props and hasattr(node, 'operation'):
-                    node.operation = props['operation']
-                if 'blend_type' in props and hasattr(node, 'blend_type'):
-                    node.blend_type = props['blend_type']
-                if 'interpolation' in props and hasattr(node, 'interpolation'):
-                    try:
-                        node.interpolation = props['interpolation']
-                    except Exception as e:
-                        logger.warning(f"Failed to set interpolation: {e}")
-                if 'extension' in props and hasattr(node, 'extension'):
+                # Common properties; setting one the node lacks raises AttributeError
+                for prop_name in _SIMPLE_NODE_PROPS:
+                    value = props.get(prop_name)
+                    if value is None:
+                        continue
                     try:
-                        node.extension = props['extension']
-                    except Exception as e:
-                        logger.warning(f"Failed to set extension: {e}")
-                if 'color_space' in props and hasattr(node, 'color_space'):
-                    try:
-                        node.color_space = props['color_space']
-                    except Exception as e:
-                        logger.warning(f"Failed to set color_space: {e}")
-                if 'label' in props:
-                    node.label = props['label']
-                if 'hide' in props:
-                    node.hide = props['hide']
-                if 'mute' in props:
-                    node.mute = props['mute']
+                        setattr(node, prop_name, value)
+                    except AttributeError:
+                        continue
+                    except (TypeError, ValueError) as e:
+                        logger.warning(f"Failed to set {prop_name}: {e}")
                 
                 # Node Group restoration
                 if 'node_tree_name' in props and hasattr(node, 'node_tree'):
@@ -316,23 +355,27 @@ class DFM_MaterialImporter:
                     
                     # Restore color stops
                     if 'elements' in ramp_data:
-                        # Clear existing elements (keep at least 2)
-                        while len(ramp.elements) > 2:
-                            ramp.elements.remove(ramp.elements[0])
+                        elements_data = ramp_data['elements']
+                        elements = ramp.elements
+                        
+                        # Drop surplus elements from the tail (keep at least 2)
+                        for _ in range(len(elements) - max(len(elements_data), 2)):
+                            elements.remove(elements[-1])
                         
                         # Add new elements
-                        elements_data = ramp_data['elements']
-                        for i, elem_data in enumerate(elements_data):
-                            if i < len(ramp.elements):
-                                # Update existing
-                                elem = ramp.elements[i]
-                            else:
-                                # Create new
-                                elem = ramp.elements.new(elem_data['position'])
-                            
-                            elem.position = elem_data['position']
-                            if 'color' in elem_data:
-                                elem.color = elem_data['color']
+                        for elem_data in elements_data[len(elements):]:
+                            elements.new(elem_data['position'])
+                        
+                        if len(elements) == len(elements_data) and all(
+                                len(elem_data.get('color', ())) == 4 for elem_data in elements_data):
+                            # Write all positions and RGBA colors in one call each
+                            elements.foreach_set("position", [elem_data['position'] for elem_data in elements_data])
+                            elements.foreach_set("color", [c for elem_data in elements_data for c in elem_data['color']])
+                        else:
+                            for elem, elem_data in zip(elements, elements_data):
+                                elem.position = elem_data['position']
+                                if 'color' in elem_data:
+                                    elem.color = elem_data['color']
                 
                 # Curve restoration (Float, RGB, Vector)
                 if 'mapping' in props and hasattr(node, 'mapping'):
@@ -345,16 +388,21 @@ class DFM_MaterialImporter:
                     if 'curves' in curves_data:
                         for curve_idx, curve_points in enumerate(curves_data['curves']):
                             if curve_idx < len(mapping.curves):
-                                curve = mapping.curves[curve_idx]
+                                points = mapping.curves[curve_idx].points
                                 
-                                # Clear existing points
-                                while len(curve.points) > 0:
-                                    curve.points.remove(curve.points[0])
+                                # Drop surplus points from the tail; a curve cannot go below 2 points
+                                for _ in range(len(points) - max(len(curve_points), 2)):
+                                    points.remove(points[-1])
                                 
-                                # Add points
-                                for point_data in curve_points:
-                                    point = curve.points.new(point_data['location'][0], 
-                                                            point_data['location'][1])
+                                # Reuse remaining points, then add the rest
+                                existing_count = len(points)
+                                for i, point_data in enumerate(curve_points):
+                                    x, y = point_data['location'][0], point_data['location'][1]
+                                    if i < existing_count:
+                                        point = points[i]
+                                        point.location = (x, y)
+                                    else:
+                                        point = points.new(x, y)
                                     if 'handle_type' in point_data:
                                         point.handle_type = point_data['handle_type']
                         
@@ -363,19 +411,28 @@ class DFM_MaterialImporter:
             
             # Set input default values
             if 'inputs' in node_data:
+                inputs = node.inputs
+                input_count = len(inputs)
                 for i, input_data in enumerate(node_data['inputs']):
-                    if i < len(node.inputs):
+                    if i < input_count:
                         default_value = input_data.get('default_value')
                         if default_value is not None:
+                            socket = inputs[i]
+                            # Assigning tags the node tree for an update, so skip values already in place
+                            if _values_equal(getattr(socket, 'default_value', None), default_value):
+                                continue
                             try:
-                                node.inputs[i].default_value = default_value
+                                socket.default_value = default_value
                             except (TypeError, AttributeError, ValueError) as e:
                                 # Some sockets might not accept the value or wrong size
-                                logger.debug(f"Skipped setting default_value for {node.name}.{node.inputs[i].name}: {e}")
-                                pass
+                                logger.debug(f"Skipped setting default_value for {node.name}.{socket.name}: {e}")
             
             created_nodes[node_data['name']] = node
         
+        # Socket name -> socket maps per node name, built on first use by a link
+        output_sockets = {}
+        input_sockets = {}
+        
         # Create node links (connections between nodes)
         for link_data in links_data:
             try:
@@ -383,25 +440,25 @@ class DFM_MaterialImporter:
                 to_node = created_nodes.get(link_data['to_node'])
                 
                 if from_node and to_node:
-                    from_socket = None
-                    to_socket = None
-                    
                     # Find the output socket
-                    for output in from_node.outputs:
-                        if output.name == link_data['from_socket']:
-                            from_socket = output
-                            break
+                    from_sockets = output_sockets.get(link_data['from_node'])
+                    if from_sockets is None:
+                        from_sockets = DFM_MaterialImporter._sockets_by_name(from_node.outputs)
+                        output_sockets[link_data['from_node']] = from_sockets
+                    from_socket = from_sockets.get(link_data['from_socket'])
                     
                     # Find the input socket
-                    for input in to_node.inputs:
-                        if input.name == link_data['to_socket']:
-                            to_socket = input
-                            break
+                    to_sockets = input_sockets.get(link_data['to_node'])
+                    if to_sockets is None:
+                        to_sockets = DFM_MaterialImporter._sockets_by_name(to_node.inputs)
+                        input_sockets[link_data['to_node']] = to_sockets
+                    to_socket = to_sockets.get(link_data['to_socket'])
                     
                     # Create the link
                     if from_socket and to_socket:
                         node_tree.links.new(from_socket, to_socket)
-                        logger.debug(f"Linked {from_node.name}.{from_socket.name} to {to_node.name}.{to_socket.name}")
+                        if debug_enabled:
+                            logger.debug(f"Linked {from_node.name}.{from_socket.name} to {to_node.name}.{to_socket.name}")
                     else:
                         if not from_socket:
                             logger.warning(f"Socket not found: {link_data['from_node']}.{link_data['from_socket']}")
@@ -415,6 +472,44 @@ class DFM_MaterialImporter:
             except Exception as e:
                 logger.warning(f"Failed to create link: {e}")
     
+    @staticmethod
+    def _list_texture_files(textures_dir: str) -> set:
+        """Return the normcase'd paths of the files directly inside textures_dir"""
+        try:
+            with os.scandir(textures_dir) as entries:
+                return {os.path.normcase(entry.path) for entry in entries if entry.is_file()}
+        except OSError:
+            return set()
+    
+    @staticmethod
+    def _sockets_by_name(sockets) -> Dict[str, Any]:
+        """Map socket names to sockets; the first socket wins for duplicate names"""
+        by_name = {}
+        for socket in sockets:
+            name = socket.name
+            if name not in by_name:
+                by_name[name] = socket
+        return by_name
+    
+    @staticmethod
+    def _get_cached_texture(texture_path: str, mtime_ns: int) -> Optional[bpy.types.Image]:
+        """Return the image cached for texture_path, reloading it if the file changed"""
+        cached = _texture_cache.get(texture_path)
+        if cached is None:
+            return None
+        cached_mtime, image_name = cached
+        image = bpy.data.images.get(image_name)
+        # The image may have been removed, renamed or repointed since it was cached;
+        # "Make Paths Relative" or a first save may have rewritten its path to //...
+        if image is None or (os.path.normpath(bpy.path.abspath(image.filepath))
+                             != os.path.normpath(texture_path)):
+            del _texture_cache[texture_path]
+            return None
+        if cached_mtime != mtime_ns:
+            logger.debug(f"Reloading changed texture: {texture_path}")
+            image.reload()
+        return image
+    
     @staticmethod
     def cleanup_unused_images() -> int:
         """
@@ -2,10 +2,10 @@
 Migration utilities for Difference Engine addon
 """
 import os
-import json
 import logging
 import shutil
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
+from .utils import json_dumps, json_loads, write_file_atomic
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -14,6 +14,24 @@ logger = logging.getLogger(__name__)
 _migration_cache = {}
 
 
+def _snapshot_file(src: str, dst: str) -> None:
+    """
+    Snapshot src to dst, hardlinking when possible and copying otherwise.
+    
+    Only safe for files that are later replaced atomically (write_file_atomic),
+    since rewriting src in place would also change the hardlinked snapshot.
+    
+    Args:
+        src: File to snapshot
+        dst: Snapshot path
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Cross-device or no hardlink support on this filesystem
+        shutil.copyfile(src, dst)
+
+
 class DFM_Migration:
     """Handles migration of data structures between versions"""
     
@@ -25,10 +43,11 @@ class DFM_Migration:
         """Get data version from commit.json file"""
         try:
             commit_file = os.path.join(commit_dir, "commit.json")
-            if os.path.exists(commit_file):
-                with open(commit_file, 'r') as f:
-                    data = json.load(f)
-                    return data.get('data_version', '1.0')
+            with open(commit_file, 'rb') as f:
+                data = json_loads(f.read())
+                return data.get('data_version', '1.0')
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.debug(f"Failed to read version from {commit_dir}: {e}")
         return '1.0'  # Default to oldest version
@@ -46,12 +65,12 @@ class DFM_Migration:
         """
         try:
             commit_file = os.path.join(commit_dir, "commit.json")
-            if not os.path.exists(commit_file):
+            try:
+                with open(commit_file, 'rb') as f:
+                    data = json_loads(f.read())
+            except FileNotFoundError:
                 return True
             
-            with open(commit_file, 'r') as f:
-                data = json.load(f)
-            
             current_version = data.get('data_version', '1.0')
             
             # No migration needed if already at current version
@@ -63,7 +82,7 @@ class DFM_Migration:
             # Backup original
             backup_file = commit_file + '.backup'
             if not os.path.exists(backup_file):
-                shutil.copy2(commit_file, backup_file)
+                _snapshot_file(commit_file, backup_file)
             
             # Update to current version
             data['data_version'] = DFM_Migration.CURRENT_VERSION
@@ -77,9 +96,9 @@ class DFM_Migration:
                     'uv_layout': True
                 }
             
-            # Save migrated data
-            with open(commit_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Save migrated data (compact, matching commits written by the exporter).
+            # The atomic replace gives commit.json a new inode, leaving the backup intact.
+            write_file_atomic(commit_file, json_dumps(data))
             
             logger.info(f"Successfully migrated commit: {commit_dir}")
             return True
@@ -88,6 +107,34 @@ class DFM_Migration:
             logger.error(f"Failed to migrate commit data: {e}")
             return False
     
+    @staticmethod
+    def iter_commit_dirs(base_dir: str) -> Iterator[str]:
+        """
+        Yield every commit directory under base_dir in a single traversal.
+        
+        Walks mesh/branch/commit levels with one os.scandir per directory and
+        relies on the cached dirent type, so no extra stat is issued per entry.
+        Commit directories are leaves and are not descended into.
+        
+        Args:
+            base_dir: Base directory of difference machine data
+            
+        Yields:
+            Full path of each commit directory
+        """
+        with os.scandir(base_dir) as mesh_entries:
+            mesh_dirs = [e.path for e in mesh_entries if e.is_dir(follow_symlinks=False)]
+        
+        for mesh_dir in mesh_dirs:
+            with os.scandir(mesh_dir) as branch_entries:
+                branch_dirs = [e.path for e in branch_entries
+                               if e.is_dir(follow_symlinks=False) and e.name != '.backup']
+            
+            for branch_dir in branch_dirs:
+                with os.scandir(branch_dir) as commit_entries:
+                    commit_dirs = [e.path for e in commit_entries if e.is_dir(follow_symlinks=False)]
+                yield from commit_dirs
+    
     @staticmethod
     def migrate_all_commits(base_dir: str) -> bool:
         """
@@ -106,29 +153,15 @@ class DFM_Migration:
             migrated_count = 0
             failed_count = 0
             
-            for mesh_name in os.listdir(base_dir):
-                mesh_dir = os.path.join(base_dir, mesh_name)
-                if not os.path.isdir(mesh_dir):
-                    continue
-                
-                for branch_name in os.listdir(mesh_dir):
-                    branch_dir = os.path.join(mesh_dir, branch_name)
-                    if not os.path.isdir(branch_dir) or branch_name == '.backup':
-                        continue
-                    
-                    for commit_name in os.listdir(branch_dir):
-                        commit_dir = os.path.join(branch_dir, commit_name)
-                        if not os.path.isdir(commit_dir):
-                            continue
-                        
-                        try:
-                            if DFM_Migration.migrate_commit_data_format(commit_dir):
-                                migrated_count += 1
-                            else:
-                                failed_count += 1
-                        except Exception as e:
-                            logger.error(f"Failed to migrate {commit_dir}: {e}")
-                            failed_count += 1
+            for commit_dir in DFM_Migration.iter_commit_dirs(base_dir):
+                try:
+                    if DFM_Migration.migrate_commit_data_format(commit_dir):
+                        migrated_count += 1
+                    else:
+                        failed_count += 1
+                except Exception as e:
+                    logger.error(f"Failed to migrate {commit_dir}: {e}")
+                    failed_count += 1
             
             logger.info(f"Migration completed: {migrated_count} succeeded, {failed_count} failed")
             return failed_count == 0
@@ -158,34 +191,28 @@ class DFM_Migration:
             migrated_count = 0
             
             # Find all mesh directories
-            for mesh_name in os.listdir(base_dir):
-                mesh_dir = os.path.join(base_dir, mesh_name)
-                if not os.path.isdir(mesh_dir):
-                    continue
-                
-                # Check if old commits_index.json exists
+            with os.scandir(base_dir) as entries:
+                mesh_dirs = [(e.name, e.path) for e in entries if e.is_dir(follow_symlinks=False)]
+            
+            for mesh_name, mesh_dir in mesh_dirs:
+                # Load old index, if this mesh still has one
                 old_index_path = os.path.join(mesh_dir, 'commits_index.json')
-                if not os.path.exists(old_index_path):
-                    continue
-                
-                logger.info(f"Migrating commit index for mesh: {mesh_name}")
-                
-                # Load old index
                 try:
-                    with open(old_index_path, 'r') as f:
-                        old_index_data = json.load(f)
+                    with open(old_index_path, 'rb') as f:
+                        old_index_data = json_loads(f.read())
                     old_commits = old_index_data.get('commits', [])
+                except FileNotFoundError:
+                    continue
                 except Exception as e:
                     logger.error(f"Failed to load old index for {mesh_name}: {e}")
                     continue
                 
+                logger.info(f"Migrating commit index for mesh: {mesh_name}")
+                
                 # Group commits by branch
-                branch_commits = {}
+                branch_commits: Dict[str, List[Dict[str, Any]]] = {}
                 for commit in old_commits:
-                    branch_name = commit.get('branch', 'main')
-                    if branch_name not in branch_commits:
-                        branch_commits[branch_name] = []
-                    branch_commits[branch_name].append(commit)
+                    branch_commits.setdefault(commit.get('branch', 'main'), []).append(commit)
                 
                 # Create new branch-level indexes
                 for branch_name, commits in branch_commits.items():
@@ -205,8 +232,7 @@ class DFM_Migration:
                     
                     # Save new index
                     try:
-                        with open(new_index_path, 'w') as f:
-                            json.dump(new_index_data, f)
+                        write_file_atomic(new_index_path, json_dumps(new_index_data))
                         logger.info(f"Created branch index: {new_index_path}")
                         migrated_count += 1
                     except Exception as e:
@@ -252,11 +278,10 @@ class DFM_Migration:
                 return False
             
             # Look for any mesh directories with old commit indexes
-            for mesh_name in os.listdir(base_dir):
-                mesh_dir = os.path.join(base_dir, mesh_name)
-                if not os.path.isdir(mesh_dir):
-                    continue
-                
+            with os.scandir(base_dir) as entries:
+                mesh_dirs = [e.path for e in entries if e.is_dir(follow_symlinks=False)]
+            
+            for mesh_dir in mesh_dirs:
                 old_index_path = os.path.join(mesh_dir, 'commits_index.json')
                 if os.path.exists(old_index_path):
                     _migration_cache[base_dir] = True
@@ -35,8 +35,10 @@ class DFM_CreateBranchOperator(bpy.types.Operator):
             os.makedirs(branch_dir, exist_ok=True)
             scene.dfm_current_branch = self.branch_name
             
-            # Save the current branch to persist across restarts
             from ..version_manager import DFM_VersionManager
+            DFM_VersionManager.invalidate_path_cache(branch_dir)
+            
+            # Save the current branch to persist across restarts
             DFM_VersionManager.save_current_branch(active_obj.name, self.branch_name)
             
             # Refresh the branch list to show the new branch
@@ -210,6 +212,8 @@ class DFM_DeleteBranchOperator(bpy.types.Operator):
         try:
             import shutil
             shutil.rmtree(branch_dir)
+            from ..version_manager import DFM_VersionManager
+            DFM_VersionManager.invalidate_path_cache(branch_dir)
             self.report({'INFO'}, f"Deleted branch: {branch_name}")
             
             # Refresh the branch list and commit list
@@ -9,12 +9,15 @@ import time
 from datetime import datetime
 from ..material_exporter import DFM_MaterialExporter
 from ..version_manager import DFM_VersionManager
-from ..utils import sanitize_path_component, safe_float, safe_vector3, validate_export_data_size, estimate_mesh_memory_usage
+from ..utils import sanitize_path_component, safe_float, safe_vector3, validate_export_data_size, estimate_mesh_memory_usage, json_dumps
 from ..progress_manager import DFM_ProgressManager
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Write buffer for large JSON payloads (json.dump emits many small chunks)
+JSON_WRITE_BUFFER_SIZE = 64 * 1024
+
 
 class DFM_SaveGeometryOperator(bpy.types.Operator):
     bl_idname = "object.save_geometry"
@@ -54,8 +57,9 @@ class DFM_SaveGeometryOperator(bpy.types.Operator):
         mesh_dir = os.path.join(base_dir, sanitize_path_component(obj.name))
         branch_dir = os.path.join(mesh_dir, sanitize_path_component(current_branch))
         
-        # Create timestamp for this commit
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        # Create timestamp for this commit (single clock read for dir name and metadata)
+        now = datetime.now()
+        timestamp = now.strftime("%Y-%m-%d_%H-%M-%S")
         commit_dir = os.path.join(branch_dir, timestamp)
         
         logger.info(f"Exporting {obj.name} to branch {current_branch}")
@@ -65,6 +69,7 @@ class DFM_SaveGeometryOperator(bpy.types.Operator):
         for attempt in range(max_retries):
             try:
                 os.makedirs(commit_dir, exist_ok=True)
+                DFM_VersionManager.invalidate_path_cache(commit_dir)
                 break
             except OSError as e:
                 if attempt == max_retries - 1:
@@ -77,7 +82,7 @@ class DFM_SaveGeometryOperator(bpy.types.Operator):
         commit_data = {
             "data_version": "1.1",  # Track data format version for migrations
             "timestamp": timestamp,
-            "datetime": datetime.now().isoformat(),
+            "datetime": now.isoformat(),
             "commit_message": commit_message,
             "tag": commit_tag,
             "branch": current_branch,
@@ -101,7 +106,7 @@ class DFM_SaveGeometryOperator(bpy.types.Operator):
                     # Write full geometry data
                     # Note: No indentation for 20-30% faster writes and smaller files
                     geometry_file = os.path.join(commit_dir, "geometry.json")
-                    with open(geometry_file, 'w') as f:
+                    with open(geometry_file, 'w', encoding='utf-8', buffering=JSON_WRITE_BUFFER_SIZE) as f:
                         json.dump(mesh_data, f)
                     commit_data["files"]["geometry"] = "geometry.json"
                 except Exception as e:
@@ -115,8 +120,8 @@ class DFM_SaveGeometryOperator(bpy.types.Operator):
                     
                     # Write full transform data
                     transform_file = os.path.join(commit_dir, "transform.json")
-                    with open(transform_file, 'w') as f:
-                        json.dump(transform_data, f)
+                    with open(transform_file, 'wb') as f:
+                        f.write(json_dumps(transform_data))
                     commit_data["files"]["transform"] = "transform.json"
                 except Exception as e:
                     self.report({'ERROR'}, f"Transform export error: {str(e)}")
@@ -140,8 +145,8 @@ class DFM_SaveGeometryOperator(bpy.types.Operator):
             
             # Save commit info
             commit_file = os.path.join(commit_dir, "commit.json")
-            with open(commit_file, 'w') as f:
-                json.dump(commit_data, f)
+            with open(commit_file, 'wb') as f:
+                f.write(json_dumps(commit_data))
             
             # Auto-compress old versions if enabled
             if auto_compress:
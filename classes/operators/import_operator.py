@@ -7,6 +7,7 @@ import json
 import os
 import logging
 from ..material_importer import DFM_MaterialImporter
+from ..utils import json_loads
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -94,8 +95,8 @@ class DFM_LoadGeometryOperator(bpy.types.Operator):
                 # Try to get mesh name from commit.json if only importing materials/transform
                 commit_file = os.path.join(commit_dir, "commit.json")
                 if os.path.exists(commit_file):
-                    with open(commit_file, 'r') as f:
-                        commit_data = json.load(f)
+                    with open(commit_file, 'rb') as f:
+                        commit_data = json_loads(f.read())
                     mesh_name = commit_data.get('mesh_name', 'ImportedMesh')
             
             # Determine import mode
@@ -207,8 +208,8 @@ class DFM_LoadGeometryOperator(bpy.types.Operator):
         """Import object transformation"""
         transform_file = os.path.join(commit_dir, "transform.json")
         if os.path.exists(transform_file):
-            with open(transform_file, 'r') as f:
-                transform_data = json.load(f)
+            with open(transform_file, 'rb') as f:
+                transform_data = json_loads(f.read())
             
             if 'location' in transform_data:
                 obj.location = transform_data['location']
@@ -4,6 +4,7 @@ Version control operators for loading and comparing versions
 import bpy
 import logging
 from ..version_manager import DFM_VersionManager
+from ..utils import json_loads
 
 # Module-level logger for use in helper methods
 logger = logging.getLogger(__name__)
@@ -139,7 +140,6 @@ class DFM_CompareVersionsOperator(bpy.types.Operator):
     )
     
     def execute(self, context):
-        import json
         import os
         import logging
         
@@ -166,8 +166,8 @@ class DFM_CompareVersionsOperator(bpy.types.Operator):
         commit_name = "Version"
         try:
             if os.path.exists(commit_file):
-                with open(commit_file, 'r') as f:
-                    commit_data = json.load(f)
+                with open(commit_file, 'rb') as f:
+                    commit_data = json_loads(f.read())
                 commit_name = commit_data.get('timestamp', 'Version')
                 logger.info(f"Comparing with version: {commit_name}")
         except Exception as e:
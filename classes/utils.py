@@ -4,13 +4,28 @@ Utility functions for Difference Machine addon
 import re
 import math
 import os
+import json
 import logging
-from typing import Any, Union, List, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Collection, Union, List, Dict, Optional, Tuple
 from pathlib import Path
 
+# orjson is an optional C-accelerated JSON backend; fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Characters that are unsafe in path components
+_UNSAFE_PATH_CHARS = frozenset('/\\:*?"<>|')
+_UNSAFE_PATH_CHARS_RE = re.compile(r'[/\\:*?"<>|]')
+
+# Default extensions accepted by is_safe_file_extension
+_SAFE_FILE_EXTENSIONS = frozenset({'.json', '.png', '.jpg', '.jpeg', '.tga', '.bmp', '.exr'})
+
 
 def sanitize_path_component(name: Any) -> str:
     """
@@ -30,8 +45,17 @@ def sanitize_path_component(name: Any) -> str:
     if not name:
         raise ValueError("Path component cannot be None or empty")
     
-    # Convert to string and remove path separators and special characters
-    safe_name = re.sub(r'[/\\:*?"<>|]', '_', str(name))
+    return _sanitize_path_component(str(name))
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_path_component(name: str) -> str:
+    """Cached implementation of sanitize_path_component for string input"""
+    # Remove path separators and special characters (clean names skip the regex)
+    if _UNSAFE_PATH_CHARS.isdisjoint(name):
+        safe_name = name
+    else:
+        safe_name = _UNSAFE_PATH_CHARS_RE.sub('_', name)
     
     # Remove leading/trailing dots and spaces
     safe_name = safe_name.strip('. ')
@@ -127,6 +151,76 @@ def convert_to_json_serializable(obj: Any) -> Union[None, bool, str, int, float,
         return None
 
 
+def json_dumps(obj: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON bytes.
+    
+    Uses orjson when it is installed and falls back to the stdlib json
+    module otherwise. The result is meant to be written to a file opened
+    in binary mode with a single write call.
+    
+    Args:
+        obj: JSON-serializable object
+        pretty: Whether to indent the output with two spaces
+        
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    # Compact separators, matching orjson's default output
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document read from disk.
+    
+    Uses orjson when it is installed and falls back to the stdlib json
+    module otherwise. Both backends raise json.JSONDecodeError on
+    malformed input.
+    
+    Args:
+        data: Raw JSON document as bytes or str
+        
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_file_atomic(file_path: str, data: bytes) -> None:
+    """
+    Write bytes to a file with a single write, replacing it atomically.
+    
+    The data goes to a temporary file next to the target which is then
+    moved over it with os.replace, so readers never observe a partially
+    written file and an interrupted write leaves the original intact.
+    
+    Args:
+        file_path: Destination file path
+        data: Complete file contents
+        
+    Raises:
+        OSError: If the file cannot be written or replaced
+    """
+    tmp_path = file_path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, file_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def validate_file_path(file_path: str, must_exist: bool = False, must_be_file: bool = False, allow_absolute: bool = False) -> bool:
     """
     Validate a file path for security and correctness.
@@ -295,19 +389,20 @@ def get_file_size_mb(file_path: str) -> float:
         return 0.0
 
 
-def is_safe_file_extension(file_path: str, allowed_extensions: Tuple[str, ...] = None) -> bool:
+def is_safe_file_extension(file_path: str, allowed_extensions: Collection[str] = None) -> bool:
     """
     Check if file has a safe extension.
     
     Args:
         file_path: Path to check
-        allowed_extensions: Tuple of allowed extensions (defaults to common safe extensions)
+        allowed_extensions: Collection of allowed extensions, ideally a frozenset
+                            (defaults to common safe extensions)
         
     Returns:
         True if extension is safe, False otherwise
     """
     if allowed_extensions is None:
-        allowed_extensions = ('.json', '.png', '.jpg', '.jpeg', '.tga', '.bmp', '.exr')
+        allowed_extensions = _SAFE_FILE_EXTENSIONS
     
     try:
         ext = Path(file_path).suffix.lower()
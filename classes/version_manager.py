@@ -7,12 +7,110 @@ import os
 import shutil
 import zipfile
 import logging
-from typing import List, Dict, Any, Optional
-from .utils import sanitize_path_component
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Tuple
+from .utils import sanitize_path_component, json_dumps, json_loads
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Subdirectory listings keyed by path, invalidated by the directory's st_mtime_ns
+# and explicitly whenever commit directories are created or removed, since
+# coarse-mtime filesystems (FAT, network shares) can miss same-tick changes
+_subdir_cache: Dict[str, Tuple[int, Tuple[str, ...]]] = {}
+
+# Parsed JSON metadata files keyed by path, tagged with (st_mtime_ns, st_size)
+_json_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+# Upper bound on entries per cache; the least recently used entry is evicted first
+_CACHE_MAX_ENTRIES = 1024
+
+
+def _cache_get(cache: Dict[str, Any], key: str) -> Any:
+    """Look up a bounded cache entry, moving it to the most recently used end"""
+    value = cache.pop(key, None)
+    if value is not None:
+        cache[key] = value
+    return value
+
+
+def _cache_put(cache: Dict[str, Any], key: str, value: Any) -> None:
+    """Insert into a bounded cache, evicting the least recently used entry when full"""
+    cache.pop(key, None)
+    if len(cache) >= _CACHE_MAX_ENTRIES:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+def _forget_path(path: str) -> None:
+    """Drop cached listings for path and the two directories above it, and cached files below it"""
+    prefix = path + os.sep
+    for file_path in [p for p in _json_cache if p.startswith(prefix)]:
+        del _json_cache[file_path]
+    for _ in range(3):
+        _subdir_cache.pop(path, None)
+        path = os.path.dirname(path)
+
+
+def _list_subdirs(path: str) -> Tuple[str, ...]:
+    """
+    List names of subdirectories of path, reusing the cached listing if unchanged.
+    
+    Adding or removing an entry updates the directory's mtime, so a matching
+    mtime means the cached names are still current and only one stat is paid.
+    
+    Args:
+        path: Directory to list
+        
+    Returns:
+        Tuple of subdirectory names
+        
+    Raises:
+        OSError: If the directory cannot be read
+    """
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _cache_get(_subdir_cache, path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    
+    with os.scandir(path) as entries:
+        names = tuple(e.name for e in entries if e.is_dir(follow_symlinks=False))
+    _cache_put(_subdir_cache, path, (mtime_ns, names))
+    return names
+
+
+def _read_json_file(file_path: str) -> Dict[str, Any]:
+    """
+    Read a JSON metadata file, reusing the cached parse if the file is unchanged.
+    
+    Used for commit.json and current_branch.json, which are re-read on every
+    history refresh and object switch but rarely change.
+    
+    Args:
+        file_path: Path to the JSON file
+        
+    Returns:
+        Shallow copy of the parsed data, safe for the caller to annotate
+        
+    Raises:
+        FileNotFoundError: If the file does not exist
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    st = os.stat(file_path)
+    tag = (st.st_mtime_ns, st.st_size)
+    cached = _cache_get(_json_cache, file_path)
+    if cached is not None and cached[0] == tag:
+        return dict(cached[1])
+    if not st.st_size:
+        # Truncated write; no need to open and parse
+        raise json.JSONDecodeError("Empty JSON file", "", 0)
+    
+    with open(file_path, 'rb') as f:
+        data = json_loads(f.read())
+    _cache_put(_json_cache, file_path, (tag, data))
+    return dict(data)
+
 
 class DFM_VersionManager:
     """Manages version control operations"""
@@ -36,37 +134,40 @@ class DFM_VersionManager:
         
         history = []
         try:
-            for branch in os.listdir(mesh_dir):
+            for branch in _list_subdirs(mesh_dir):
+                # Sanitized branch names never start with a dot; skip .backup and the like
+                if branch.startswith('.'):
+                    continue
                 branch_path = os.path.join(mesh_dir, branch)
-                if os.path.isdir(branch_path):
-                    try:
-                        for commit in os.listdir(branch_path):
-                            commit_path = os.path.join(branch_path, commit)
-                            commit_file = os.path.join(commit_path, "commit.json")
-                            
-                            if os.path.exists(commit_file):
-                                try:
-                                    with open(commit_file, 'r') as f:
-                                        commit_data = json.load(f)
-                                        # Validate required fields
-                                        if 'timestamp' not in commit_data:
-                                            logger.warning(f"Commit file missing timestamp: {commit_file}")
-                                            continue
-                                        commit_data['commit_path'] = commit_path
-                                        commit_data['branch'] = branch
-                                        history.append(commit_data)
-                                except (json.JSONDecodeError, IOError) as e:
-                                    logger.error(f"Failed to read commit file {commit_file}: {e}")
-                                    continue
-                    except OSError as e:
-                        logger.error(f"Failed to read branch directory {branch_path}: {e}")
-                        continue
+                try:
+                    for commit in _list_subdirs(branch_path):
+                        commit_path = os.path.join(branch_path, commit)
+                        commit_file = os.path.join(commit_path, "commit.json")
+                        
+                        try:
+                            commit_data = _read_json_file(commit_file)
+                        except FileNotFoundError:
+                            continue
+                        except (json.JSONDecodeError, IOError) as e:
+                            logger.error(f"Failed to read commit file {commit_file}: {e}")
+                            continue
+                        
+                        # Validate required fields
+                        if 'timestamp' not in commit_data:
+                            logger.warning(f"Commit file missing timestamp: {commit_file}")
+                            continue
+                        commit_data['commit_path'] = commit_path
+                        commit_data['branch'] = branch
+                        history.append(commit_data)
+                except OSError as e:
+                    logger.error(f"Failed to read branch directory {branch_path}: {e}")
+                    continue
         except OSError as e:
             logger.error(f"Failed to read mesh directory {mesh_dir}: {e}")
             return []
-        # Sort by timestamp (newest first) with safe default
+        # Sort by timestamp (newest first); entries without one were skipped above
         try:
-            history.sort(key=lambda x: x.get('timestamp', '0000-00-00_00-00-00'), reverse=True)
+            history.sort(key=itemgetter('timestamp'), reverse=True)
         except Exception as e:
             logger.debug(f"Failed to sort history by timestamp: {e}")
         return history
@@ -92,31 +193,31 @@ class DFM_VersionManager:
         
         history = []
         try:
-            for commit in os.listdir(branch_path):
+            for commit in _list_subdirs(branch_path):
                 commit_path = os.path.join(branch_path, commit)
-                if os.path.isdir(commit_path):
-                    commit_file = os.path.join(commit_path, "commit.json")
-                    
-                    if os.path.exists(commit_file):
-                        try:
-                            with open(commit_file, 'r') as f:
-                                commit_data = json.load(f)
-                                # Validate required fields
-                                if 'timestamp' not in commit_data:
-                                    logger.warning(f"Commit file missing timestamp: {commit_file}")
-                                    continue
-                                commit_data['commit_path'] = commit_path
-                                commit_data['branch'] = branch_name
-                                history.append(commit_data)
-                        except (json.JSONDecodeError, IOError) as e:
-                            logger.error(f"Failed to read commit file {commit_file}: {e}")
-                            continue
+                commit_file = os.path.join(commit_path, "commit.json")
+                
+                try:
+                    commit_data = _read_json_file(commit_file)
+                except FileNotFoundError:
+                    continue
+                except (json.JSONDecodeError, IOError) as e:
+                    logger.error(f"Failed to read commit file {commit_file}: {e}")
+                    continue
+                
+                # Validate required fields
+                if 'timestamp' not in commit_data:
+                    logger.warning(f"Commit file missing timestamp: {commit_file}")
+                    continue
+                commit_data['commit_path'] = commit_path
+                commit_data['branch'] = branch_name
+                history.append(commit_data)
         except OSError as e:
             logger.error(f"Failed to read branch directory {branch_path}: {e}")
             return []
         
-        # Sort by timestamp with safe default
-        history.sort(key=lambda x: x.get('timestamp', '0000-00-00_00-00-00'), reverse=True)
+        # Sort by timestamp; entries without one were skipped above
+        history.sort(key=itemgetter('timestamp'), reverse=True)
         return history
     
     @staticmethod
@@ -138,37 +239,32 @@ class DFM_VersionManager:
         
         branches = []
         try:
-            for branch_name in os.listdir(mesh_dir):
+            for branch_name in _list_subdirs(mesh_dir):
+                if branch_name.startswith('.'):
+                    continue
                 branch_path = os.path.join(mesh_dir, branch_name)
-                if os.path.isdir(branch_path) and branch_name != '.backup':
-                    try:
-                        # Count commits in this branch
-                        commit_count = 0
-                        last_commit = ""
-                        
-                        commit_dirs = [d for d in os.listdir(branch_path) if os.path.isdir(os.path.join(branch_path, d))]
-                        for commit_dir in commit_dirs:
-                            commit_path = os.path.join(branch_path, commit_dir)
-                            if os.path.isdir(commit_path):
-                                commit_file = os.path.join(commit_path, "commit.json")
-                                if os.path.exists(commit_file):
-                                    commit_count += 1
-                        # Determine last commit by max timestamp-like dir name
-                        if commit_dirs:
-                            try:
-                                last_commit = max(commit_dirs)
-                            except Exception:
-                                last_commit = commit_dirs[0]
-                        
-                        branches.append({
-                            'name': branch_name,
-                            'commit_count': commit_count,
-                            'last_commit': last_commit
-                        })
-                        
-                    except OSError as e:
-                        logger.error(f"Failed to read branch directory {branch_path}: {e}")
-                        continue
+                try:
+                    # Count commits in this branch, tracking the newest
+                    # timestamp-named commit directory in the same pass
+                    commit_count = 0
+                    last_commit = ""
+                    
+                    for commit_dir in _list_subdirs(branch_path):
+                        commit_file = os.path.join(branch_path, commit_dir, "commit.json")
+                        if os.path.exists(commit_file):
+                            commit_count += 1
+                            if commit_dir > last_commit:
+                                last_commit = commit_dir
+                    
+                    branches.append({
+                        'name': branch_name,
+                        'commit_count': commit_count,
+                        'last_commit': last_commit
+                    })
+                    
+                except OSError as e:
+                    logger.error(f"Failed to read branch directory {branch_path}: {e}")
+                    continue
         except OSError as e:
             logger.error(f"Failed to read mesh directory {mesh_dir}: {e}")
             return []
@@ -178,6 +274,16 @@ class DFM_VersionManager:
         
         return branches
     
+    @staticmethod
+    def invalidate_path_cache(path: str) -> None:
+        """
+        Forget cached directory listings after creating or removing a directory.
+        
+        Args:
+            path: Commit, branch or mesh directory that was created or removed
+        """
+        _forget_path(path.rstrip(os.sep))
+    
     @staticmethod
     def compress_old_versions(mesh_name: str, keep_versions: int = 10) -> None:
         """
@@ -199,6 +305,7 @@ class DFM_VersionManager:
             return
         
         compressed_count = 0
+        base_dir = bpy.path.abspath("//.difference_machine/")
         # Keep the most recent versions, compress the rest
         for commit in history[keep_versions:]:
             commit_path = commit['commit_path']
@@ -209,7 +316,6 @@ class DFM_VersionManager:
                 continue
             
             # Additional security check - ensure path is within expected directory
-            base_dir = bpy.path.abspath("//.difference_machine/")
             if not commit_path.startswith(base_dir):
                 logger.warning(f"Commit path outside expected directory: {commit_path}")
                 continue
@@ -244,6 +350,7 @@ class DFM_VersionManager:
                 
                 # Only remove original after successful validation
                 shutil.rmtree(commit_path)
+                _forget_path(commit_path)
                 compressed_count += 1
                 logger.info(f"Successfully compressed and removed: {commit_path}")
                 
@@ -284,6 +391,7 @@ class DFM_VersionManager:
             # Remove the directory if it exists
             if os.path.isdir(commit_path):
                 shutil.rmtree(commit_path)
+                _forget_path(commit_path)
                 logger.info(f"Deleted commit directory: {commit_path}")
             
             # Remove the zip file if it exists
@@ -323,8 +431,21 @@ class DFM_VersionManager:
             }
             
             branch_file = os.path.join(mesh_dir, 'current_branch.json')
-            with open(branch_file, 'w') as f:
-                json.dump(branch_info, f, indent=2)
+            payload = json_dumps(branch_info)
+            
+            # Skip the rewrite when the stored branch info is already identical
+            try:
+                with open(branch_file, 'rb') as f:
+                    if f.read() == payload:
+                        logger.debug(f"Current branch '{branch_name}' for mesh '{mesh_name}' is unchanged")
+                        return True
+            except FileNotFoundError:
+                pass
+            
+            with open(branch_file, 'wb') as f:
+                f.write(payload)
+            # Same-size rewrites can land within one mtime tick; never serve the old parse
+            _json_cache.pop(branch_file, None)
             
             logger.info(f"Saved current branch '{branch_name}' for mesh '{mesh_name}'")
             
@@ -350,12 +471,11 @@ class DFM_VersionManager:
             mesh_dir = os.path.join(base_dir, sanitize_path_component(mesh_name))
             branch_file = os.path.join(mesh_dir, 'current_branch.json')
             
-            if not os.path.exists(branch_file):
+            try:
+                branch_info = _read_json_file(branch_file)
+            except FileNotFoundError:
                 return 'main'
             
-            with open(branch_file, 'r') as f:
-                branch_info = json.load(f)
-            
             current_branch = branch_info.get('current_branch', 'main')
             logger.info(f"Loaded current branch '{current_branch}' for mesh '{mesh_name}'")
             return current_branch
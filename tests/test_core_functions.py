@@ -21,15 +21,24 @@ from classes.utils import (
     convert_to_json_serializable,
     validate_export_data_size,
     estimate_mesh_memory_usage,
-    is_safe_file_extension
+    is_safe_file_extension,
+    json_dumps,
+    json_loads,
+    write_file_atomic
 )
 from classes.error_handler import (
     DFM_Error,
     DFM_ValidationError,
     DFM_FileOperationError,
-    DFM_ErrorHandler
+    DFM_ErrorHandler,
+    DFM_ErrorType,
+    error_handler_decorator
 )
-from classes.config import DFM_Config, DFM_ConfigManager
+from classes.config import DFM_Config, DFM_ConfigManager, get_config_manager
+from classes.migration import DFM_Migration
+from classes import version_manager
+from classes.version_manager import DFM_VersionManager
+from classes.material_importer import _resolve_node_type, _values_equal
 
 
 class TestUtils(unittest.TestCase):
@@ -45,6 +54,10 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(sanitize_path_component("test/../file"), "test_.._file")
         self.assertEqual(sanitize_path_component("file:name"), "file_name")
         self.assertEqual(sanitize_path_component("file*name"), "file_name")
+        self.assertEqual(sanitize_path_component("dir\\file|name"), "dir_file_name")
+        
+        # Clean names are returned unchanged
+        self.assertEqual(sanitize_path_component("2024-01-01_10-30-00"), "2024-01-01_10-30-00")
         
         # Test edge cases
         with self.assertRaises(ValueError):
@@ -157,6 +170,39 @@ class TestUtils(unittest.TestCase):
         self.assertTrue(is_safe_file_extension("test.py", ('.py', '.json')))
         self.assertFalse(is_safe_file_extension("test.exe", ('.py', '.json')))
 
+    
+    def test_json_dumps_loads_roundtrip(self):
+        """Test JSON helpers round-trip through bytes"""
+        data = {"timestamp": "2024-01-01_10-30-00", "files": {"geometry": "geometry.json"}, "count": 3}
+        
+        payload = json_dumps(data)
+        self.assertIsInstance(payload, bytes)
+        self.assertEqual(json_loads(payload), data)
+        self.assertNotIn(b", ", payload)
+        
+        # Pretty output is still valid JSON and spans multiple lines
+        pretty = json_dumps(data, pretty=True)
+        self.assertIn(b"\n", pretty)
+        self.assertEqual(json_loads(pretty), data)
+        
+        # Malformed input raises the stdlib decode error with either backend
+        with self.assertRaises(json.JSONDecodeError):
+            json_loads(b"{not json")
+    
+    def test_write_file_atomic(self):
+        """Test atomic file replacement leaves no temporary file behind"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "index.json")
+            write_file_atomic(file_path, b'{"a": 1}')
+            write_file_atomic(file_path, b'{"a": 2}')
+            
+            with open(file_path, "rb") as f:
+                self.assertEqual(f.read(), b'{"a": 2}')
+            self.assertEqual(os.listdir(temp_dir), ["index.json"])
+            
+            with self.assertRaises(OSError):
+                write_file_atomic(os.path.join(temp_dir, "missing", "index.json"), b"{}")
+
 
 class TestErrorHandler(unittest.TestCase):
     """Test error handling system"""
@@ -168,12 +214,29 @@ class TestErrorHandler(unittest.TestCase):
         self.assertEqual(error.message, "Test error")
         self.assertEqual(error.details["key"], "value")
     
+    def test_dfm_error_traceback(self):
+        """Test DFM_Error captures the in-flight exception traceback"""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            error = DFM_Error("Wrapped error")
+        
+        self.assertIn("ValueError: boom", error.traceback)
+        self.assertIs(error.traceback, error.traceback)
+        self.assertEqual(error.to_dict()["traceback"], error.traceback)
+    
     def test_validation_error(self):
         """Test DFM_ValidationError"""
         error = DFM_ValidationError("Invalid input", field="test_field", value="bad_value")
         self.assertEqual(error.error_type.value, "validation_error")
         self.assertEqual(error.details["field"], "test_field")
         self.assertEqual(error.details["value"], "bad_value")
+        self.assertEqual(error.field, "test_field")
+        self.assertEqual(error.to_dict()["details"], {"field": "test_field", "value": "bad_value"})
+        
+        # Details stay assignable
+        error.details = {"field": "other"}
+        self.assertEqual(error.to_dict()["details"], {"field": "other"})
     
     def test_file_operation_error(self):
         """Test DFM_FileOperationError"""
@@ -196,6 +259,66 @@ class TestErrorHandler(unittest.TestCase):
         params_with_none = {"key1": "value1", "key2": None}
         with self.assertRaises(DFM_ValidationError):
             DFM_ErrorHandler.validate_required_params(params_with_none, ["key1", "key2"])
+    
+    def test_handle_operator_error(self):
+        """Test operator errors are reported and logged with a type hint"""
+        operator = Mock()
+        error = DFM_FileOperationError("Cannot write", file_path="/test/path")
+        
+        with self.assertLogs("classes.error_handler", level="ERROR") as logs:
+            result = DFM_ErrorHandler.handle_operator_error(operator, error, "export")
+        
+        self.assertEqual(result, {'CANCELLED'})
+        operator.report.assert_called_once_with({'ERROR'}, "file_operation_error: Cannot write")
+        self.assertTrue(any("check file paths and permissions" in line for line in logs.output))
+    
+    def test_safe_execute(self):
+        """Test safe_execute returns errors and honours exc_types"""
+        result, error = DFM_ErrorHandler.safe_execute(int, "42")
+        self.assertEqual(result, 42)
+        self.assertIsNone(error)
+        
+        result, error = DFM_ErrorHandler.safe_execute(int, "bad", exc_types=(ValueError,))
+        self.assertIsNone(result)
+        self.assertIsInstance(error, ValueError)
+        
+        with self.assertRaises(TypeError):
+            DFM_ErrorHandler.safe_execute(int, None, exc_types=(ValueError,))
+    
+    def test_handle_function_error_logs_traceback(self):
+        """Test generic function errors are logged with their traceback"""
+        try:
+            raise KeyError("missing")
+        except KeyError as e:
+            error = e
+        
+        with self.assertLogs("classes.error_handler", level="ERROR") as logs:
+            DFM_ErrorHandler.handle_function_error("sample", error)
+        
+        self.assertTrue(any("Traceback" in line and "KeyError" in line for line in logs.output))
+    
+    def test_error_handler_decorator(self):
+        """Test decorator keeps metadata and wraps generic exceptions"""
+        @error_handler_decorator(DFM_ErrorType.MATERIAL_ERROR)
+        def sample(value):
+            """Sample docstring"""
+            if value is None:
+                raise KeyError("missing")
+            return value * 2
+        
+        self.assertEqual(sample.__name__, "sample")
+        self.assertEqual(sample.__doc__, "Sample docstring")
+        self.assertEqual(sample(2), 4)
+        
+        with self.assertRaises(DFM_Error) as ctx:
+            sample(None)
+        self.assertEqual(ctx.exception.error_type, DFM_ErrorType.MATERIAL_ERROR)
+        self.assertIsInstance(ctx.exception.__cause__, KeyError)
+        
+        # Raising the log level after decoration still enables operation logging
+        with self.assertLogs("classes.error_handler", level="INFO") as logs:
+            sample(3)
+        self.assertTrue(any("Starting operation: sample" in line for line in logs.output))
 
 
 class TestConfig(unittest.TestCase):
@@ -217,12 +340,22 @@ class TestConfig(unittest.TestCase):
         config.DEFAULT_CHUNK_SIZE = -1
         with self.assertRaises(ValueError):
             config.validate()
+        
+        # Test all failures are reported together
+        config.ALLOWED_FILE_EXTENSIONS = frozenset()
+        with self.assertRaises(ValueError) as ctx:
+            config.validate()
+        self.assertIn("DEFAULT_CHUNK_SIZE must be positive", str(ctx.exception))
+        self.assertIn("ALLOWED_FILE_EXTENSIONS must not be empty", str(ctx.exception))
     
     def test_config_manager_singleton(self):
         """Test config manager singleton pattern"""
         manager1 = DFM_ConfigManager()
         manager2 = DFM_ConfigManager()
         self.assertIs(manager1, manager2)
+        self.assertIs(get_config_manager(), manager1)
+        self.assertIsInstance(manager1.config, DFM_Config)
+        self.assertFalse(hasattr(manager1, "__dict__"))
     
     def test_config_save_load(self):
         """Test configuration save and load"""
@@ -237,6 +370,39 @@ class TestConfig(unittest.TestCase):
             # Test load
             loaded_config = DFM_Config.load_from_file(config_path)
             self.assertEqual(loaded_config.DEFAULT_CHUNK_SIZE, 2000)
+            self.assertIsInstance(loaded_config.ALLOWED_FILE_EXTENSIONS, frozenset)
+            self.assertEqual(loaded_config.ALLOWED_FILE_EXTENSIONS, config.ALLOWED_FILE_EXTENSIONS)
+    
+    def test_config_manager_load_cache(self):
+        """Test that unchanged config files are not re-parsed"""
+        manager = DFM_ConfigManager()
+        # The manager is a process-wide singleton; restore its state afterwards
+        saved_state = (manager._config, manager._loaded_path, manager._loaded_mtime)
+        
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                config_path = os.path.join(temp_dir, "config.json")
+                config = DFM_Config()
+                config.DEFAULT_CHUNK_SIZE = 1500
+                self.assertTrue(config.save_to_file(config_path))
+                
+                self.assertTrue(manager.load_config(temp_dir))
+                self.assertEqual(manager.config.DEFAULT_CHUNK_SIZE, 1500)
+                
+                # Unchanged file is served from the cached config
+                with patch.object(DFM_Config, 'load_from_file') as mock_load:
+                    self.assertTrue(manager.load_config(temp_dir))
+                    mock_load.assert_not_called()
+                
+                # Modified file is re-parsed
+                config.DEFAULT_CHUNK_SIZE = 2500
+                self.assertTrue(config.save_to_file(config_path))
+                stat = os.stat(config_path)
+                os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+                self.assertTrue(manager.load_config(temp_dir))
+                self.assertEqual(manager.config.DEFAULT_CHUNK_SIZE, 2500)
+        finally:
+            manager._config, manager._loaded_path, manager._loaded_mtime = saved_state
     
     def test_config_update(self):
         """Test configuration update"""
@@ -253,6 +419,127 @@ class TestConfig(unittest.TestCase):
         self.assertFalse(result)
 
 
+class TestMigration(unittest.TestCase):
+    """Test data migration helpers"""
+    
+    def test_migrate_commit_indexes_to_branches(self):
+        """Test mesh-level indexes are split into branch-level indexes"""
+        with tempfile.TemporaryDirectory() as base_dir:
+            mesh_dir = os.path.join(base_dir, "Cube")
+            for branch in ("main", "dev"):
+                os.makedirs(os.path.join(mesh_dir, branch))
+            with open(os.path.join(base_dir, "notes.txt"), "w") as f:
+                f.write("not a mesh")
+            with open(os.path.join(mesh_dir, "commits_index.json"), "w") as f:
+                json.dump({"commits": [{"branch": "main", "timestamp": "a"},
+                                       {"branch": "dev", "timestamp": "b"}]}, f)
+            
+            DFM_Migration.clear_migration_cache()
+            self.assertTrue(DFM_Migration.check_migration_needed(base_dir))
+            self.assertTrue(DFM_Migration.migrate_commit_indexes_to_branches(base_dir))
+            
+            with open(os.path.join(mesh_dir, "dev", "commits_index.json")) as f:
+                self.assertEqual(json.load(f)["commits"], [{"branch": "dev", "timestamp": "b"}])
+            self.assertTrue(os.path.exists(os.path.join(mesh_dir, "commits_index.json.backup")))
+            
+            DFM_Migration.clear_migration_cache()
+            self.assertFalse(DFM_Migration.check_migration_needed(base_dir))
+    
+    def test_migrate_commit_data_format(self):
+        """Test commit upgrade keeps an untouched backup of the original"""
+        with tempfile.TemporaryDirectory() as commit_dir:
+            commit_file = os.path.join(commit_dir, "commit.json")
+            with open(commit_file, "w") as f:
+                json.dump({"timestamp": "2024-01-01_00-00-00"}, f)
+            
+            self.assertTrue(DFM_Migration.migrate_commit_data_format(commit_dir))
+            self.assertEqual(DFM_Migration.get_data_version(commit_dir), DFM_Migration.CURRENT_VERSION)
+            
+            with open(commit_file + ".backup") as f:
+                self.assertEqual(json.load(f), {"timestamp": "2024-01-01_00-00-00"})
+
+
+class TestVersionManager(unittest.TestCase):
+    """Test version manager helpers"""
+    
+    def test_read_json_file_cache(self):
+        """Test metadata files are re-parsed only when they change"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            commit_file = os.path.join(temp_dir, "commit.json")
+            with open(commit_file, "w") as f:
+                json.dump({"timestamp": "2024-01-01_00-00-00", "commit_message": "first"}, f)
+            
+            data = version_manager._read_json_file(commit_file)
+            data["commit_path"] = temp_dir
+            
+            # Cached parse is reused and not affected by caller annotations
+            with patch.object(version_manager, "json_loads") as mock_loads:
+                cached = version_manager._read_json_file(commit_file)
+                mock_loads.assert_not_called()
+            self.assertEqual(cached["commit_message"], "first")
+            self.assertNotIn("commit_path", cached)
+            
+            with open(commit_file, "w") as f:
+                json.dump({"timestamp": "2024-01-01_00-00-00", "commit_message": "second"}, f)
+            self.assertEqual(version_manager._read_json_file(commit_file)["commit_message"], "second")
+            
+            # Removing a commit directory drops its cached metadata
+            DFM_VersionManager.invalidate_path_cache(temp_dir)
+            self.assertNotIn(commit_file, version_manager._json_cache)
+            
+            os.remove(commit_file)
+            with self.assertRaises(FileNotFoundError):
+                version_manager._read_json_file(commit_file)
+
+
+    def test_list_subdirs_invalidation(self):
+        """Test explicit invalidation and the size bound of the listing cache"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            branch_dir = os.path.join(temp_dir, "main")
+            os.makedirs(os.path.join(branch_dir, "2024-01-01_00-00-00"))
+            self.assertEqual(version_manager._list_subdirs(branch_dir), ("2024-01-01_00-00-00",))
+            
+            # A new commit in the same mtime tick is only seen after invalidation
+            mtime_ns = os.stat(branch_dir).st_mtime_ns
+            commit_dir = os.path.join(branch_dir, "2024-01-01_00-00-01")
+            os.makedirs(commit_dir)
+            os.utime(branch_dir, ns=(mtime_ns, mtime_ns))
+            self.assertEqual(len(version_manager._list_subdirs(branch_dir)), 1)
+            DFM_VersionManager.invalidate_path_cache(commit_dir)
+            self.assertEqual(len(version_manager._list_subdirs(branch_dir)), 2)
+        
+        with patch.object(version_manager, "_CACHE_MAX_ENTRIES", 2):
+            cache = {}
+            for key in ("a", "b", "c"):
+                version_manager._cache_put(cache, key, key)
+            self.assertEqual(list(cache), ["b", "c"])
+            
+            # A hit marks the entry as recently used, so the other one is evicted
+            self.assertEqual(version_manager._cache_get(cache, "b"), "b")
+            version_manager._cache_put(cache, "d", "d")
+            self.assertEqual(list(cache), ["b", "d"])
+
+
+class TestMaterialImporter(unittest.TestCase):
+    """Test material importer helpers"""
+    
+    def test_resolve_node_type(self):
+        """Test exported node types resolve to Blender node class names"""
+        self.assertEqual(_resolve_node_type("BSDF_PRINCIPLED"), "ShaderNodeBsdfPrincipled")
+        self.assertEqual(_resolve_node_type("TEX_IMAGE"), "ShaderNodeTexImage")
+        self.assertEqual(_resolve_node_type("VALTORGB"), "ShaderNodeValToRGB")
+        self.assertEqual(_resolve_node_type("ShaderNodeMath"), "ShaderNodeMath")
+    
+    def test_values_equal(self):
+        """Test unchanged socket values are detected within float32 precision"""
+        self.assertTrue(_values_equal(0.5, 0.5))
+        self.assertTrue(_values_equal((0.8, 0.8, 0.8, 1.0), [0.800000011920929, 0.8, 0.8, 1.0]))
+        self.assertFalse(_values_equal((0.8, 0.8, 0.8, 1.0), [0.8, 0.8, 0.8]))
+        self.assertFalse(_values_equal(0.5, 0.6))
+        self.assertFalse(_values_equal(None, 0.0))
+        self.assertTrue(_values_equal("UV", "UV"))
+
+
 class TestConvertToJsonSerializable(unittest.TestCase):
     """Test JSON serialization conversion"""
     